@@ -2,33 +2,55 @@ import os
 import json
 import time
 import re
+import string
 import sys
 import logging
 import warnings
 import asyncio
 import atexit
-from typing import Dict, Optional, Union
+import sqlite3
+import functools
+import collections
+import heapq
+import random
+import signal
+import concurrent.futures
+import threading
+import types
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, Union
 from dotenv import load_dotenv
 import requests
-from pypresence import Presence
-import psutil
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import win32gui
 import win32process
 import ctypes
+from ctypes import wintypes
+
+# pypresence and psutil are imported where they are used so --test and setup paths don't load them up front
+if TYPE_CHECKING:
+    import psutil
+    from pypresence import Presence
 
 # Suppress specific warnings
 warnings.filterwarnings("ignore", message="There is no current event loop", category=RuntimeWarning)
 warnings.filterwarnings("ignore", message="Task was destroyed but it is pending!", category=RuntimeWarning)
 
+class LogSafeFormatter(logging.Formatter):
+    """Formatter that runs string arguments through clean_title_for_logging, only for records actually emitted."""
+    def format(self, record: logging.LogRecord) -> str:
+        if isinstance(record.args, tuple):
+            record.args = tuple(clean_title_for_logging(arg) if isinstance(arg, str) else arg for arg in record.args)
+        return super().format(record)
+
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler("discord_presence.log")
-    ]
-)
+_log_handlers = [
+    logging.StreamHandler(),
+    logging.FileHandler("discord_presence.log")
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(LogSafeFormatter('%(asctime)s - %(levelname)s - %(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=_log_handlers)
 logger = logging.getLogger(__name__)
 
 # Load environment variables
@@ -38,15 +60,50 @@ DISNEY_CLIENT_ID = os.getenv("DISNEY_CLIENT_ID") or DISCORD_CLIENT_ID
 NETFLIX_CLIENT_ID = os.getenv("NETFLIX_CLIENT_ID") or DISCORD_CLIENT_ID
 TMDB_API_KEY = os.getenv("TMDB_API_KEY")
 TMDB_API_BASE = 'https://api.themoviedb.org/3'
+_TMDB_TV_URL = f"{TMDB_API_BASE}/search/tv"
+_TMDB_MOVIE_URL = f"{TMDB_API_BASE}/search/movie"
+_TMDB_SEARCH_URLS = {"tv": _TMDB_TV_URL, "movie": _TMDB_MOVIE_URL}
+_TMDB_API_PARAMS = {"api_key": TMDB_API_KEY}
+_TMDB_SEARCH_PARAMS = {**_TMDB_API_PARAMS, "include_adult": "false"}  # Filter adult content for better matches
 UPDATE_INTERVAL = 15  # seconds
+MIN_INTERVAL = 5  # seconds between polls while media is playing
+MAX_INTERVAL = 120  # seconds between polls after a long idle stretch
+ERROR_MAX_INTERVAL = 60  # seconds between polls while detection keeps failing
+POLL_JITTER = 0.1  # +/- fraction applied to every wait
+HEARTBEAT_INTERVAL = 5  # seconds between Discord reconnect checks, independent of the poll interval
+RETRY_BACKOFF_BASE = 1.3  # growth factor between Discord connection retries
+RETRY_BACKOFF_MIN = 0.5  # seconds before the first retry
+RETRY_BACKOFF_MAX = 10  # seconds
+TMDB_CACHE_FILE = "tmdb_cache.db"
+TMDB_CACHE_TTL = 7 * 24 * 60 * 60  # seconds
 
 # Constants
 NETFLIX_APP_NAME = "Netflix"
 DISNEY_APP_NAME = "Disney+"
 NETFLIX_DOMAINS = ["netflix.com", "www.netflix.com"]
 DISNEY_DOMAINS = ["disneyplus.com", "www.disneyplus.com"]
-NETFLIX_PROCESS_NAMES = ["Netflix.exe", "WWAHost.exe"]  # WWAHost.exe is for UWP version
-DISNEY_PROCESS_NAMES = ["Disney+.exe", "WWAHost.exe"]   # WWAHost.exe is for UWP version
+# Lowercased process names that may host the streaming apps, including generic UWP hosts (WWAHost.exe)
+DISNEY_PROC_NAMES = frozenset({"disney+.exe", "wwahost.exe", "applicationframehost.exe", "explorer.exe"})
+NETFLIX_PROC_NAMES = frozenset({"netflix.exe", "wwahost.exe", "applicationframehost.exe"})
+GENERIC_HOST_PROC_NAMES = frozenset({"applicationframehost.exe", "wwahost.exe", "explorer.exe"})  # Hosts that need a command line or window check
+# Lowercased browser titles that are just the service's landing page
+DISNEY_PLACEHOLDER_TITLES = frozenset({"disney+ | disney+", "disney+"})
+NETFLIX_PLACEHOLDER_TITLES = frozenset({"netflix", "home - netflix"})
+
+# Presence assets and links per service
+SERVICE_URLS = {"Netflix": "https://www.netflix.com", "Disney+": "https://www.disneyplus.com"}
+SERVICE_IMAGE_KEYS = {"Netflix": "netflix", "Disney+": "disney"}  # Static image keys uploaded to Discord
+TMDB_IMG_PREFIX = "https://image.tmdb.org/t/p/w200"
+
+# Fixed presence sent by --test; read-only so it can be shared safely
+TEST_MEDIA = types.MappingProxyType({
+    "isWatching": True,
+    "service": "Netflix",
+    "title": "Test Show",
+    "type": "show",
+    "season": 1,
+    "episode": 1
+})
 
 # Browser detection
 SUPPORTED_BROWSERS = {
@@ -55,51 +112,234 @@ SUPPORTED_BROWSERS = {
     "firefox.exe": "Firefox",
     "brave.exe": "Brave"
 }
+SUPPORTED_BROWSERS_LOWER = {k.lower(): v for k, v in SUPPORTED_BROWSERS.items()}
+
+# Precompiled regular expressions
+# Title cleanup: service names and browser window information are removed in one scan
+_SERVICE_TITLE_PATTERNS = {
+    "Disney+": (" | Disney+", " - Disney+", " – Disney+", "Disney+ - ", " Disney+"),
+    "Netflix": (" - Netflix", " | Netflix", "Netflix - ", " Netflix"),
+}
+_BROWSER_NAME_SUFFIXES = (" - Google Chrome", " - Brave", " - Firefox")
+_BROWSER_CHROME_PATTERN = r'\s+(?:and \d+ more pages.*|- Personal.*|- Microsoft.*Edge)'
+_BROWSER_CHROME_RE = re.compile(_BROWSER_CHROME_PATTERN)
+_SERVICE_CLEANUP_RES = {
+    service: re.compile("|".join(map(re.escape, patterns)) + "|" + _BROWSER_CHROME_PATTERN)
+    for service, patterns in _SERVICE_TITLE_PATTERNS.items()
+}
+# Stray "on" left over after removing the service name
+_ON_END_RE = re.compile(r'\s+on\s*$')
+_ON_START_RE = re.compile(r'^\s*on\s+')
+_ON_MIDDLE_RE = re.compile(r'\s+on\s+')
+# Episode patterns: "Show Name: S1:E1 Episode Title" (Netflix) or "Show Name - S01E01 - Episode Title" (Disney+)
+_EPISODE_RE = re.compile(
+    r"(?P<title>.*?)(?:"
+    r":\s+S(?P<n_season>\d+):E(?P<n_episode>\d+)(?:\s+(?P<n_episode_title>.+))?"
+    r"|\s+-\s+S(?P<d_season>\d+)E(?P<d_episode>\d+)(?:\s+-\s+(?P<d_episode_title>.+))?"
+    r")"
+)
+# Series title extraction for image search
+_SERIES_S_RE = re.compile(r'^(.*?)\s+S\d+')
+_SERIES_SE_RE = re.compile(r'^(.*?)\s+-\s+S\d+E\d+')
+_SERIES_SEASON_EPISODE_RE = re.compile(r'^(.*?)\s+S(?:eason)?\s*\d+\s+E(?:pisode)?\s*\d+', re.IGNORECASE)
+# TMDB query simplification
+_PUNCTUATION_TABLE = str.maketrans({c: ' ' for c in string.punctuation if c not in "'_"})  # Keep apostrophes for names like "Grey's"
+_STANDALONE_NUMBER_RE = re.compile(r'\s\d+\s')
+# Browser tabs showing documentation rather than streaming content
+_DOC_SKIP_RE = re.compile(r'readme|\.md|documentation|github|\.txt|license|coding|programming|developer', re.IGNORECASE)
+# Service names and multi-tab markers in window titles, found with one scan per title
+_SERVICE_MARKERS = frozenset({NETFLIX_APP_NAME, DISNEY_APP_NAME})
+_MULTI_TAB_MARKERS = frozenset({"more pages", "more tab", "and tab"})
+_TITLE_MARKER_RE = re.compile("|".join(map(re.escape, sorted(_SERVICE_MARKERS | _MULTI_TAB_MARKERS))))
+# False positive filters; every pattern is lowercase and matched against lowercased titles
+IGNORE_PATTERNS = (
+    ".env", "settings", "config", "cursor", "visual studio", "vscode",
+    "code editor", "discord", "settings.json", "explorer", "file", "folder",
+    "cmd", "command", "powershell", "terminal", "python", "readme", "github",
+    ".md", "markdown", "documentation", "notepad", "editor", "setting",
+    "preference", "profile", "account", "login", "sign in", "guide", "tutorial",
+    "help", "support", "download", "upload", "install", "setup", "configure",
+    "json", "xml", "yaml", "ini", "conf", "log", "txt", "text", "document",
+    "license", "copyright", "about", "information", "readme.md", "cursor",
+    "disney + & netflix", "streaming", "presence", "rich presence", "discord presence"
+)
+_IGNORE_RE = re.compile("|".join(map(re.escape, IGNORE_PATTERNS)))
+_NATIVE_IGNORE_RE = re.compile(r'\.env|settings|cursor|code editor', re.IGNORECASE)
+_DOC_TITLE_RE = re.compile(r'readme|\.md|documentation')
+_DEV_CONTENT_RE = re.compile(r'repo|repository|project|folder|file|code|github')
+_PROJECT_DOC_RE = re.compile(r'disney \+ & netflix|streaming')
+_TAB_FALSE_POSITIVE_RE = re.compile(r'readme|\.md|documentation|github|developer|programming|code|disney \+ & netflix', re.IGNORECASE)
+
+# Discord RPC connection; None until connected
+rpc: Optional["Presence"] = None
+# Reconnect backoff: a pending reconnect may run once time.monotonic() passes the deadline (0 = none pending)
+_reconnect_deadline = 0.0
+_reconnect_failures = 0
+RECONNECT_MAX_DELAY = 30  # seconds
 
 # Track current media state
 current_media = None
 start_timestamp = None
+_last_update_ts = 0.0  # time of the last presence update Discord accepted
+_last_forced_update = 0.0  # time of the last forced refresh attempt, successful or not
+FORCE_UPDATE_INTERVAL = 180  # seconds between forced refreshes of unchanged presence
+
+# Characters dropped from titles before logging: zero-width/bidi marks and non-whitespace control characters
+_LOG_CLEAN_TABLE = dict.fromkeys(
+    [c for c in list(range(0, 32)) + list(range(127, 160)) if not chr(c).isspace()]
+    + [0x200b, 0x200c, 0x200d, 0x200e, 0x200f, 0xfeff],
+    None
+)
+
+# Direct user32 bindings for window titles; one buffer is reused across EnumWindows callbacks
+_user32 = ctypes.WinDLL("user32")
+_user32.GetWindowTextLengthW.argtypes = [wintypes.HWND]
+_user32.GetWindowTextLengthW.restype = ctypes.c_int
+_user32.GetWindowTextW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+_user32.GetWindowTextW.restype = ctypes.c_int
+_user32.GetWindow.argtypes = [wintypes.HWND, wintypes.UINT]
+_user32.GetWindow.restype = wintypes.HWND
+GW_OWNER = 4
+WINDOW_TEXT_BUFFER_SIZE = 512
+_window_text_buffer = ctypes.create_unicode_buffer(WINDOW_TEXT_BUFFER_SIZE)
+
+# Toolhelp32 process snapshot bindings, used to look for Discord without building psutil objects
+class PROCESSENTRY32W(ctypes.Structure):
+    _fields_ = [
+        ("dwSize", wintypes.DWORD),
+        ("cntUsage", wintypes.DWORD),
+        ("th32ProcessID", wintypes.DWORD),
+        ("th32DefaultHeapID", ctypes.c_size_t),
+        ("th32ModuleID", wintypes.DWORD),
+        ("cntThreads", wintypes.DWORD),
+        ("th32ParentProcessID", wintypes.DWORD),
+        ("pcPriClassBase", wintypes.LONG),
+        ("dwFlags", wintypes.DWORD),
+        ("szExeFile", wintypes.WCHAR * wintypes.MAX_PATH),
+    ]
+
+_kernel32 = ctypes.WinDLL("kernel32")
+_kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+_kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+_kernel32.Process32FirstW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+_kernel32.Process32FirstW.restype = wintypes.BOOL
+_kernel32.Process32NextW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+_kernel32.Process32NextW.restype = wintypes.BOOL
+_kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+_kernel32.CloseHandle.restype = wintypes.BOOL
+TH32CS_SNAPPROCESS = 0x00000002
+INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+# Shared HTTP session so TMDB requests reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(total=2, backoff_factor=0.3)))
+
+# Blocking detection and Discord IPC run on one worker thread so the asyncio main loop stays free;
+# pypresence drives its own event loop, so every rpc call has to stay off the main loop's thread
+_WORKER = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="presence")
+
+# Discord process watchdog: a background thread keeps the event in step with whether Discord is running
+DISCORD_WATCH_INTERVAL = 30  # seconds
+discord_running_event = threading.Event()
+_discord_watchdog: Optional[threading.Thread] = None
+# Set on Ctrl+C; the main loop, watchdog and connection retries stop waiting as soon as it is
+shutdown_event = threading.Event()
+
+# Process list shared by the checks of one detection cycle: (time.monotonic() when taken, processes)
+PROCESS_SNAPSHOT_TTL = 1.0  # seconds
+_process_snapshot = (float("-inf"), [])
+# Top-level window list shared the same way, taken only once a check needs more than the foreground window
+_window_snapshot = (float("-inf"), [])
+
+# Persistent TMDB poster cache (opened lazily on first lookup)
+_tmdb_cache_db = None
 
 def get_active_window_title() -> Optional[str]:
     """Get the title of the currently active window."""
     return win32gui.GetWindowText(win32gui.GetForegroundWindow())
 
+def get_window_text(hwnd: int) -> str:
+    """Get a window title, returning early for untitled windows."""
+    length = _user32.GetWindowTextLengthW(hwnd)
+    if not length:
+        return ""
+    buffer = _window_text_buffer
+    if length >= WINDOW_TEXT_BUFFER_SIZE:
+        buffer = ctypes.create_unicode_buffer(length + 1)
+    _user32.GetWindowTextW(hwnd, buffer, len(buffer))
+    return buffer.value
+
 def get_process_name_by_hwnd(hwnd: int) -> Optional[str]:
     """Get process name from window handle."""
+    import psutil
     try:
         _, pid = win32process.GetWindowThreadProcessId(hwnd)
         process = psutil.Process(pid)
-        return process.name()
+        return get_process_name(pid, process.create_time())
     except (psutil.NoSuchProcess, psutil.AccessDenied):
         return None
 
+@functools.lru_cache(maxsize=512)
+def get_process_name(pid: int, create_time: float) -> str:
+    """Get process name, memoized per process (pid + creation time guards against pid reuse)."""
+    import psutil
+    return psutil.Process(pid).name()
+
 def enum_windows_callback(hwnd: int, windows: list) -> bool:
     """Callback for EnumWindows to get all window titles."""
-    # Include all windows, not just visible ones
-    window_title = win32gui.GetWindowText(hwnd)
+    # Include all windows, not just visible ones, but skip owned popups and dialogs
+    if _user32.GetWindow(hwnd, GW_OWNER):
+        return True
+    window_title = get_window_text(hwnd)
     if window_title:
-        process_name = get_process_name_by_hwnd(hwnd)
-        windows.append((hwnd, window_title, process_name))
+        windows.append((hwnd, window_title))
     return True
 
+def enum_browser_windows_callback(hwnd: int, context: tuple) -> bool:
+    """Callback for EnumWindows to collect windows owned by browser processes."""
+    windows, browser_pids = context
+    # GetWindowThreadProcessId is cheap, so non-browser windows never reach psutil
+    _, pid = win32process.GetWindowThreadProcessId(hwnd)
+    process_name = browser_pids.get(pid)
+    if process_name:
+        window_title = get_window_text(hwnd)
+        if window_title:
+            windows.append((hwnd, window_title, process_name))
+    return True
+
+def get_browser_windows(browser_pids: Dict[int, str]) -> list:
+    """Get all windows owned by the given browser pids, with their titles and process names."""
+    windows = []
+    win32gui.EnumWindows(enum_browser_windows_callback, (windows, browser_pids))
+    return windows
+
 def get_all_windows() -> list:
-    """Get all visible windows with their titles and process names."""
+    """Get all titled top-level windows as (hwnd, title) pairs."""
     windows = []
     # Capture all windows, not just visible ones
-    win32gui.EnumWindows(lambda hwnd, windows: enum_windows_callback(hwnd, windows), windows)
+    win32gui.EnumWindows(enum_windows_callback, windows)
+    return windows
+
+def get_window_snapshot() -> list:
+    """Get all titled windows, reusing one enumeration for PROCESS_SNAPSHOT_TTL seconds."""
+    global _window_snapshot
+    
+    taken_at, windows = _window_snapshot
+    now = time.monotonic()
+    if now - taken_at >= PROCESS_SNAPSHOT_TTL:
+        windows = get_all_windows()
+        _window_snapshot = (now, windows)
     return windows
 
+@functools.lru_cache(maxsize=256)
 def clean_title_for_logging(title: str) -> str:
     """Clean title string for logging to avoid Unicode encoding errors."""
     if not title:
         return ""
     try:
-        # Remove zero-width spaces and other problematic characters
-        cleaned = title.replace('\u200b', '').replace('\u200e', '')
-        # Remove other invisible/control characters
-        cleaned = ''.join(char for char in cleaned if char.isprintable() or char.isspace())
-        # Replace any other non-ASCII characters that might cause issues
-        return cleaned.encode('ascii', 'replace').decode('ascii')
+        # Remove zero-width and control characters in one pass, then
+        # replace any other non-ASCII characters that might cause issues
+        return title.translate(_LOG_CLEAN_TABLE).encode('ascii', 'replace').decode('ascii')
     except Exception as e:
         # Super-safe fallback
         try:
@@ -109,73 +349,77 @@ def clean_title_for_logging(title: str) -> str:
             # Ultimate fallback
             return "Title with encoding issues"
 
+@functools.lru_cache(maxsize=256)
 def clean_title(title: str, service: str) -> str:
     """Clean title by removing redundant service information."""
     if not title:
         return ""
         
-    # Remove service name from title
-    if service == "Disney+":
-        patterns = [
-            " | Disney+",
-            " - Disney+",
-            " – Disney+",
-            "Disney+ - ",
-            " Disney+"
-        ]
-        for pattern in patterns:
-            title = title.replace(pattern, "")
-            
-    elif service == "Netflix":
-        patterns = [
-            " - Netflix",
-            " | Netflix",
-            "Netflix - ",
-            " Netflix"
-        ]
-        for pattern in patterns:
-            title = title.replace(pattern, "")
-    
-    # Remove browser window information from the title
-    title = re.sub(r'\s+and \d+ more pages.*', '', title)
-    title = re.sub(r'\s+- Personal.*', '', title)
-    title = re.sub(r'\s+- Microsoft.*Edge', '', title)
-    title = re.sub(r'\s+- Google Chrome', '', title)
-    title = re.sub(r'\s+- Brave', '', title)
-    title = re.sub(r'\s+- Firefox', '', title)
+    # Browser names are always the trailing part of the window title
+    for suffix in _BROWSER_NAME_SUFFIXES:
+        if title.endswith(suffix):
+            title = title[:-len(suffix)]
+            break
+
+    # Remove service name and remaining browser window information in a single pass
+    cleanup_re = _SERVICE_CLEANUP_RES.get(service, _BROWSER_CHROME_RE)
+    title = cleanup_re.sub('', title)
     
     # Remove "Watch " prefix often seen in Disney+ titles
     if title.startswith("Watch "):
         title = title[6:]
 
     # Remove the word "on" if it appears alone - important for fixing "on" text issue
-    title = re.sub(r'\s+on\s*$', '', title)  # "on" at the end
-    title = re.sub(r'^\s*on\s+', '', title)  # "on" at the start
-    title = re.sub(r'\s+on\s+', ' ', title)  # "on" in the middle
+    title = _ON_END_RE.sub('', title)  # "on" at the end
+    title = _ON_START_RE.sub('', title)  # "on" at the start
+    title = _ON_MIDDLE_RE.sub(' ', title)  # "on" in the middle
         
     # Clean up any leftover separators
     title = title.strip(" |:-–—")
         
     return title.strip()
 
+def parse_episode_title(title: str) -> Optional[Dict[str, Union[str, int]]]:
+    """Parse a "Show: S1:E1 Title" or "Show - S01E01 - Title" episode title."""
+    # Both formats need one of these markers, so skip the regex engine otherwise
+    if ":E" not in title and "-" not in title:
+        return None
+    
+    show_match = _EPISODE_RE.match(title)
+    if not show_match:
+        return None
+    
+    if show_match.group("n_season") is not None:
+        season, episode, episode_title = show_match.group("n_season", "n_episode", "n_episode_title")
+    else:
+        season, episode, episode_title = show_match.group("d_season", "d_episode", "d_episode_title")
+    
+    return {
+        "title": show_match.group("title").strip(),
+        "type": "show",
+        "season": int(season),
+        "episode": int(episode),
+        "episodeTitle": episode_title.strip() if episode_title else None
+    }
+
 def parse_netflix_title(title: str) -> Optional[Dict[str, Union[str, int]]]:
     """Parse Netflix window title to extract media information."""
+    # Callers add their own keys to the result, so never hand out the cached dict
+    media_info = _parse_netflix_title(title)
+    return media_info.copy() if media_info else None
+
+@functools.lru_cache(maxsize=256)
+def _parse_netflix_title(title: str) -> Optional[Dict[str, Union[str, int]]]:
+    """Parse Netflix window title; memoized, treat the result as read-only."""
     # Remove "Netflix - " prefix if present
     if title.startswith("Netflix - "):
         title = title[10:]
     
     # Common pattern for shows: "Show Name: S1:E1 Episode Title"
-    show_pattern = r"(.*?):\s+S(\d+):E(\d+)(?:\s+(.+))?"
-    show_match = re.match(show_pattern, title)
-    
-    if show_match:
-        return {
-            "title": show_match.group(1).strip(),
-            "type": "show",
-            "season": int(show_match.group(2)),
-            "episode": int(show_match.group(3)),
-            "episodeTitle": show_match.group(4).strip() if show_match.group(4) else None
-        }
+    show_info = parse_episode_title(title)
+    
+    if show_info:
+        return show_info
     
     # If not a show pattern, assume it's a movie
     return {
@@ -185,6 +429,13 @@ def parse_netflix_title(title: str) -> Optional[Dict[str, Union[str, int]]]:
 
 def parse_disney_title(title: str) -> Optional[Dict[str, Union[str, int]]]:
     """Parse Disney+ window title to extract media information."""
+    # Callers add their own keys to the result, so never hand out the cached dict
+    media_info = _parse_disney_title(title)
+    return media_info.copy() if media_info else None
+
+@functools.lru_cache(maxsize=256)
+def _parse_disney_title(title: str) -> Optional[Dict[str, Union[str, int]]]:
+    """Parse Disney+ window title; memoized, treat the result as read-only."""
     # Clean the title first - remove Disney+ text
     clean_title = title
     
@@ -200,27 +451,19 @@ def parse_disney_title(title: str) -> Optional[Dict[str, Union[str, int]]]:
     clean_title = clean_title.strip()
     
     # Common pattern for shows: "Show Name - S01E01 - Episode Title"
-    show_pattern = r"(.*?)\s+-\s+S(\d+)E(\d+)(?:\s+-\s+(.+))?"
-    show_match = re.match(show_pattern, clean_title)
-    
-    if show_match:
-        # Extract and clean the episode title
-        episode_title = None
-        if show_match.group(4):
-            episode_title = show_match.group(4).strip()
+    show_info = parse_episode_title(clean_title)
+    
+    if show_info:
+        # Clean the episode title
+        episode_title = show_info["episodeTitle"]
+        if episode_title:
             # Remove redundant Disney+ in episode title too
             for pattern in [" | Disney+", " - Disney+", " – Disney+", "Disney+"]:
                 if pattern in episode_title:
                     episode_title = episode_title.replace(pattern, "")
-            episode_title = episode_title.strip()
+            show_info["episodeTitle"] = episode_title.strip()
             
-        return {
-            "title": show_match.group(1).strip(),
-            "type": "show",
-            "season": int(show_match.group(2)),
-            "episode": int(show_match.group(3)),
-            "episodeTitle": episode_title
-        }
+        return show_info
     
     # If not a show pattern, assume it's a movie
     return {
@@ -228,167 +471,141 @@ def parse_disney_title(title: str) -> Optional[Dict[str, Union[str, int]]]:
         "type": "movie"
     }
 
-def check_browser_tabs() -> Optional[Dict[str, Union[str, bool, int]]]:
-    """Check browser tabs for Netflix or Disney+ content."""
-    disney_content = None
-    netflix_content = None
+def get_process_snapshot() -> list:
+    """Get running processes with pid and name, reusing one enumeration for PROCESS_SNAPSHOT_TTL seconds."""
+    global _process_snapshot
+    import psutil
+    
+    taken_at, processes = _process_snapshot
+    now = time.monotonic()
+    if now - taken_at >= PROCESS_SNAPSHOT_TTL:
+        processes = list(psutil.process_iter(['pid', 'name']))
+        _process_snapshot = (now, processes)
+    return processes
+
+def collect_browser_windows() -> list:
+    """Get all windows owned by running supported browsers, with their titles and process names."""
+    # Walk the process table once and remember which pids belong to supported browsers
+    browser_pids = {}
+    for proc in get_process_snapshot():
+        proc_name = (proc.info['name'] or "").lower()
+        if proc_name in SUPPORTED_BROWSERS_LOWER:
+            browser_pids[proc.info['pid']] = proc_name
     
-    # Track all potential streaming windows we find
+    if not browser_pids:
+        return []
+    
+    # Only windows owned by a browser process are returned
+    return get_browser_windows(browser_pids)
+
+@functools.lru_cache(maxsize=512)
+def classify_browser_title(title: str) -> Tuple[tuple, tuple]:
+    """Check a browser window title for streaming content; memoized, treat the media dicts as read-only."""
     streaming_windows = []
+    url_windows = []
     
-    # Try to find running browsers
-    for browser_process, browser_name in SUPPORTED_BROWSERS.items():
-        if any(proc.name().lower() == browser_process.lower() for proc in psutil.process_iter()):
-            try:
-                # Get all windows for this browser
-                windows = get_all_windows()
-                
-                # First pass: Check all browser windows for Disney+ and Netflix content
-                for window_hwnd, title, process_name in windows:
-                    if not process_name or not title:
-                        continue
-                    
-                    # Only look at windows for this browser
-                    if process_name.lower() != browser_process.lower():
-                        continue
-                        
-                    # Clean title for logging to avoid Unicode errors
-                    clean_log_title = clean_title_for_logging(title)    
-                    logger.debug(f"Browser window title: '{clean_log_title}'")
-                    
-                    # STRICT FILTERING: Filter out readme.md and other documentation files
-                    if any(pattern in title.lower() for pattern in [
-                        "readme", ".md", "documentation", "github", ".txt", 
-                        "license", "coding", "programming", "developer"
-                    ]):
-                        logger.info(f"Skipping documentation file: {clean_log_title}")
-                        continue
-                    
-                    # Check if it's Netflix
-                    if " - Netflix" in title or "Netflix" in title:
-                        # Additional screening - make sure it's not just a README or documentation
-                        if "readme" in title.lower() or ".md" in title.lower():
-                            logger.info(f"Skipping false Netflix detection in documentation: {clean_log_title}")
-                            continue
-                            
-                        clean_title = clean_title(title, "Netflix")
-                        logger.info(f"Detected Netflix in browser: '{clean_title_for_logging(clean_title)}'")
-                        
-                        # Try to detect if it's a show with episode info
-                        show_match = re.search(r'(.*?):\s+S(\d+):E(\d+)(?:\s+(.+))?', clean_title)
-                        if show_match:
-                            netflix_content = {
-                                "isWatching": True,
-                                "service": "Netflix",
-                                "title": show_match.group(1).strip(),
-                                "type": "show",
-                                "season": int(show_match.group(2)),
-                                "episode": int(show_match.group(3)),
-                                "episodeTitle": show_match.group(4).strip() if show_match.group(4) else None,
-                                "window_hwnd": window_hwnd,
-                                "is_visible": win32gui.IsWindowVisible(window_hwnd),
-                                "is_running": True
-                            }
-                        else:
-                            netflix_content = {
-                                "isWatching": True,
-                                "service": "Netflix",
-                                "title": clean_title,
-                                "type": "movie",
-                                "window_hwnd": window_hwnd,
-                                "is_visible": win32gui.IsWindowVisible(window_hwnd),
-                                "is_running": True
-                            }
-                        streaming_windows.append(netflix_content)
-                    
-                    # Check for Disney+ in multiple ways
-                    is_disney = False
-                    for pattern in ["Disney+", "disneyplus"]:
-                        if pattern.lower() in title.lower():
-                            is_disney = True
-                            break
-                    
-                    if is_disney:
-                        # Additional screening - make sure it's not just a README or documentation
-                        if "readme" in title.lower() or ".md" in title.lower():
-                            logger.info(f"Skipping false Disney+ detection in documentation: {clean_log_title}")
-                            continue
-                            
-                        clean_title = clean_title(title, "Disney+")
-                        logger.info(f"Detected Disney+ in browser: '{clean_title_for_logging(clean_title)}'")
-                        
-                        # Try to detect if it's a show with episode info
-                        show_match = re.search(r'(.*?)\s+-\s+S(\d+)E(\d+)(?:\s+-\s+(.+))?', clean_title)
-                        if show_match:
-                            disney_content = {
-                                "isWatching": True,
-                                "service": "Disney+",
-                                "title": show_match.group(1).strip(),
-                                "type": "show",
-                                "season": int(show_match.group(2)),
-                                "episode": int(show_match.group(3)),
-                                "episodeTitle": show_match.group(4).strip() if show_match.group(4) else None,
-                                "window_hwnd": window_hwnd,
-                                "is_visible": win32gui.IsWindowVisible(window_hwnd),
-                                "is_running": True
-                            }
-                        else:
-                            disney_content = {
-                                "isWatching": True,
-                                "service": "Disney+",
-                                "title": clean_title,
-                                "type": "movie",
-                                "window_hwnd": window_hwnd,
-                                "is_visible": win32gui.IsWindowVisible(window_hwnd),
-                                "is_running": True
-                            }
-                        streaming_windows.append(disney_content)
-                    
-                # Additional check for URLs in browser windows
-                for window_hwnd, title, process_name in windows:
-                    if not process_name or not title:
-                        continue
-                        
-                    if process_name.lower() == browser_process.lower():
-                        # Look for URLs in title
-                        if "disneyplus.com" in title.lower() or "disney+" in title.lower():
-                            clean_title = clean_title(title, "Disney+")
-                            if not clean_title or clean_title.lower() in ["disney+ | disney+", "disney+"]:
-                                clean_title = "Disney+ Content"
-                                
-                            logger.info(f"Detected Disney+ by URL: '{clean_title_for_logging(clean_title)}'")
-                            
-                            streaming_windows.append({
-                                "isWatching": True,
-                                "service": "Disney+",
-                                "title": clean_title,
-                                "type": "unknown",
-                                "window_hwnd": window_hwnd,
-                                "is_visible": win32gui.IsWindowVisible(window_hwnd),
-                                "is_running": True
-                            })
-                            
-                        elif "netflix.com" in title.lower():
-                            clean_title = clean_title(title, "Netflix")
-                            if not clean_title or clean_title.lower() in ["netflix", "home - netflix"]:
-                                clean_title = "Netflix Content"
-                                
-                            logger.info(f"Detected Netflix by URL: '{clean_title_for_logging(clean_title)}'")
-                            
-                            streaming_windows.append({
-                                "isWatching": True,
-                                "service": "Netflix",
-                                "title": clean_title,
-                                "type": "unknown",
-                                "window_hwnd": window_hwnd,
-                                "is_visible": win32gui.IsWindowVisible(window_hwnd),
-                                "is_running": True
-                            })
-                
-            except Exception as e:
-                logger.error(f"Error checking browser tabs: {e}")
-                continue
+    # Lowercase once and reuse for every substring test below
+    title_lower = title.lower()
+    
+    # Clean title for logging to avoid Unicode errors
+    clean_log_title = clean_title_for_logging(title)    
+    logger.debug(f"Browser window title: '{clean_log_title}'")
     
+    # STRICT FILTERING: Filter out readme.md and other documentation files
+    if _DOC_SKIP_RE.search(title):
+        logger.info(f"Skipping documentation file: {clean_log_title}")
+        return (), ()
+    
+    # Check if it's Netflix
+    if " - Netflix" in title or "Netflix" in title:
+        media_title = clean_title(title, "Netflix")
+        logger.info(f"Detected Netflix in browser: '{clean_title_for_logging(media_title)}'")
+        
+        # Try to detect if it's a show with episode info
+        show_info = parse_episode_title(media_title)
+        if show_info:
+            streaming_windows.append({
+                "isWatching": True,
+                "service": "Netflix",
+                **show_info
+            })
+        else:
+            streaming_windows.append({
+                "isWatching": True,
+                "service": "Netflix",
+                "title": media_title,
+                "type": "movie"
+            })
+    
+    # Check for Disney+ in multiple ways
+    if "disney+" in title_lower or "disneyplus" in title_lower:
+        media_title = clean_title(title, "Disney+")
+        logger.info(f"Detected Disney+ in browser: '{clean_title_for_logging(media_title)}'")
+        
+        # Try to detect if it's a show with episode info
+        show_info = parse_episode_title(media_title)
+        if show_info:
+            streaming_windows.append({
+                "isWatching": True,
+                "service": "Disney+",
+                **show_info
+            })
+        else:
+            streaming_windows.append({
+                "isWatching": True,
+                "service": "Disney+",
+                "title": media_title,
+                "type": "movie"
+            })
+    
+    # Additional check for URLs in the window title
+    if "disneyplus.com" in title_lower or "disney+" in title_lower:
+        media_title = clean_title(title, "Disney+")
+        if not media_title or media_title.lower() in DISNEY_PLACEHOLDER_TITLES:
+            media_title = "Disney+ Content"
+            
+        logger.info(f"Detected Disney+ by URL: '{clean_title_for_logging(media_title)}'")
+        
+        url_windows.append({
+            "isWatching": True,
+            "service": "Disney+",
+            "title": media_title,
+            "type": "unknown"
+        })
+        
+    elif "netflix.com" in title_lower:
+        media_title = clean_title(title, "Netflix")
+        if not media_title or media_title.lower() in NETFLIX_PLACEHOLDER_TITLES:
+            media_title = "Netflix Content"
+            
+        logger.info(f"Detected Netflix by URL: '{clean_title_for_logging(media_title)}'")
+        
+        url_windows.append({
+            "isWatching": True,
+            "service": "Netflix",
+            "title": media_title,
+            "type": "unknown"
+        })
+    
+    return tuple(streaming_windows), tuple(url_windows)
+
+def classify_browser_window(window_hwnd: int, title: str) -> Tuple[list, list]:
+    """Check one browser window for streaming content, returning (title matches, URL-only matches).
+
+    Each match is a (media_info, window_hwnd, is_visible) tuple holding a fresh copy of the cached media dict.
+    """
+    title_matches, url_matches = classify_browser_title(title)
+    if not title_matches and not url_matches:
+        return [], []
+    
+    is_visible = win32gui.IsWindowVisible(window_hwnd)
+    return (
+        [(dict(media), window_hwnd, is_visible) for media in title_matches],
+        [(dict(media), window_hwnd, is_visible) for media in url_matches]
+    )
+
+def select_streaming_window(streaming_windows: list, active_window_hwnd: int) -> Optional[Dict[str, Union[str, bool, int]]]:
+    """Pick the streaming window to show from (media_info, window_hwnd, is_visible) tuples."""
     # No streaming content found
     if not streaming_windows:
         return None
@@ -398,35 +615,89 @@ def check_browser_tabs() -> Optional[Dict[str, Union[str, bool, int]]]:
     # - This ensures the presence stays active even if the window is minimized
     
     # First, still prefer active window if available
-    active_window_hwnd = win32gui.GetForegroundWindow()
-    for window in streaming_windows:
-        if window["window_hwnd"] == active_window_hwnd:
-            window_copy = window.copy()
-            del window_copy["window_hwnd"]
-            del window_copy["is_visible"]
-            del window_copy["is_running"]
-            logger.info(f"Selected active streaming window: {window_copy['service']} - {window_copy['title']}")
-            return window_copy
+    for media_info, window_hwnd, _ in streaming_windows:
+        if window_hwnd == active_window_hwnd:
+            logger.info(f"Selected active streaming window: {media_info['service']} - {media_info['title']}")
+            return media_info
     
     # Next, if any window is found (even if minimized/background), use it 
-    if streaming_windows:
-        window = streaming_windows[0]
-        window_copy = window.copy()
-        del window_copy["window_hwnd"]
-        del window_copy["is_visible"]
-        del window_copy["is_running"]
-        if window["is_visible"]:
-            logger.info(f"Selected visible streaming window: {window_copy['service']} - {window_copy['title']}")
-        else:
-            logger.info(f"Selected minimized streaming window: {window_copy['service']} - {window_copy['title']}")
-        return window_copy
+    media_info, _, is_visible = streaming_windows[0]
+    if is_visible:
+        logger.info(f"Selected visible streaming window: {media_info['service']} - {media_info['title']}")
+    else:
+        logger.info(f"Selected minimized streaming window: {media_info['service']} - {media_info['title']}")
+    return media_info
+
+def check_browser_tabs() -> Optional[Dict[str, Union[str, bool, int]]]:
+    """Check browser tabs for Netflix or Disney+ content."""
+    # Track all potential streaming windows we find; URL-only matches rank after title matches
+    streaming_windows = []
+    url_windows = []
     
-    return None
+    # Fast path: when the foreground window is a browser showing streaming content,
+    # there is no need to enumerate every other window
+    active_window_hwnd = win32gui.GetForegroundWindow()
+    active_process = get_process_name_by_hwnd(active_window_hwnd)
+    if active_process and active_process.lower() in SUPPORTED_BROWSERS_LOWER:
+        active_title = get_window_text(active_window_hwnd)
+        if active_title:
+            try:
+                streaming_windows, url_windows = classify_browser_window(active_window_hwnd, active_title)
+            except Exception as e:
+                logger.error(f"Error checking active browser tab: {e}")
+    
+    if not streaming_windows and not url_windows:
+        try:
+            # Single pass: check every browser window for Disney+ and Netflix content
+            for window_hwnd, title, process_name in collect_browser_windows():
+                title_matches, url_matches = classify_browser_window(window_hwnd, title)
+                streaming_windows.extend(title_matches)
+                url_windows.extend(url_matches)
+        
+        except Exception as e:
+            logger.error(f"Error checking browser tabs: {e}")
+    
+    return select_streaming_window(streaming_windows + url_windows, active_window_hwnd)
+
+def cache_found(maxsize: int):
+    """Memoize like functools.lru_cache, but only keep results that aren't None so failed lookups are retried."""
+    def decorator(func):
+        cache = collections.OrderedDict()
+        
+        @functools.wraps(func)
+        def wrapper(*args):
+            if args in cache:
+                cache.move_to_end(args)
+                return cache[args]
+            result = func(*args)
+            if result is not None:
+                cache[args] = result
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return result
+        
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+def media_image_key(media_info: Dict) -> tuple:
+    """Get the hashable (service, title, type, season, episode) key that identifies a media image."""
+    return (
+        media_info.get("service", ""),
+        media_info.get("title", ""),
+        media_info.get("type", "movie"),
+        media_info.get("season"),
+        media_info.get("episode")
+    )
 
 def find_media_image(media_info: Dict) -> Optional[str]:
-    """Find media image from TMDB API only."""
-    title = media_info.get("title", "").strip()
-    media_type = media_info.get("type", "movie")
+    """Find media image from TMDB API only; found images are memoized per media key, so forced refreshes reuse them."""
+    return find_media_image_by_key(*media_image_key(media_info))
+
+@cache_found(maxsize=256)
+def find_media_image_by_key(service: str, title: str, media_type: str, season: Optional[int], episode: Optional[int]) -> Optional[str]:
+    """Find media image for a media_image_key() tuple; hits are memoized across polls, misses are retried."""
+    title = title.strip()
     
     # Extract the main series title and season info for TV shows
     series_title = title
@@ -435,30 +706,30 @@ def find_media_image(media_info: Dict) -> Optional[str]:
     
     if media_type == "show":
         # Get the season/episode numbers directly from media_info if available
-        season_number = media_info.get("season")
-        episode_number = media_info.get("episode")
+        season_number = season
+        episode_number = episode
         
         # Try to extract just the series name using common patterns
         # Pattern 1: "Show Name S1:E1" format
-        series_match = re.match(r'^(.*?)\s+S\d+', series_title)
+        series_match = _SERIES_S_RE.match(series_title)
         if series_match:
             series_title = series_match.group(1).strip()
             logger.info(f"Extracted series title: '{series_title}' from '{title}'")
         
         # Pattern 2: "Show Name - S01E01" format
-        series_match2 = re.match(r'^(.*?)\s+-\s+S\d+E\d+', series_title)
+        series_match2 = _SERIES_SE_RE.match(series_title)
         if series_match2:
             series_title = series_match2.group(1).strip()
             logger.info(f"Extracted series title: '{series_title}' from '{title}'")
             
         # Pattern 3: "Show Name Season 1 Episode 1" format
-        series_match3 = re.match(r'^(.*?)\s+S(?:eason)?\s*\d+\s+E(?:pisode)?\s*\d+', series_title, re.IGNORECASE)
+        series_match3 = _SERIES_SEASON_EPISODE_RE.match(series_title)
         if series_match3:
             series_title = series_match3.group(1).strip()
             logger.info(f"Extracted series title: '{series_title}' from '{title}'")
     
     # Clean title for searching
-    search_title = clean_title(series_title, media_info.get("service", ""))
+    search_title = clean_title(series_title, service)
     
     # Clean title for logging to avoid Unicode errors
     clean_log_title = clean_title_for_logging(search_title)
@@ -466,7 +737,7 @@ def find_media_image(media_info: Dict) -> Optional[str]:
     logger.info(f"Searching for image: '{clean_log_title}'")
     
     # Only use TMDB API for searching
-    tmdb_image = find_improved_tmdb_image(search_title, media_type, season_number, episode_number)
+    tmdb_image = find_cached_tmdb_image(search_title, media_type, season_number, episode_number)
     if tmdb_image:
         return tmdb_image
     
@@ -487,9 +758,9 @@ def find_improved_tmdb_image(title: str, media_type: str, season_number: Optiona
         
         # Strategy 2: Strip out any numbers or special characters that might interfere with the search
         # This helps with titles like "Grey's Anatomy S1 Episode 1" -> "Grey's Anatomy"
-        simplified_title = re.sub(r'[^\w\s\']', ' ', title)  # Keep apostrophes for names like "Grey's"
-        simplified_title = re.sub(r'\s\d+\s', ' ', simplified_title)  # Remove standalone numbers
-        simplified_title = re.sub(r'\s+', ' ', simplified_title).strip()  # Fix multiple spaces
+        simplified_title = title.translate(_PUNCTUATION_TABLE)  # Punctuation to spaces
+        simplified_title = _STANDALONE_NUMBER_RE.sub(' ', simplified_title)  # Remove standalone numbers
+        simplified_title = ' '.join(simplified_title.split())  # Fix multiple spaces
         
         if simplified_title != title:
             logger.info(f"Also trying simplified title: '{simplified_title}'")
@@ -511,13 +782,9 @@ def find_improved_tmdb_image(title: str, media_type: str, season_number: Optiona
                 logger.info(f"Trying TMDB search for {search_type}: '{search_title}'")
                 
                 try:
-                    response = requests.get(
-                        f"{TMDB_API_BASE}/search/{search_type}",
-                        params={
-                            "api_key": TMDB_API_KEY,
-                            "query": search_title,
-                            "include_adult": "false"  # Filter adult content for better matches
-                        },
+                    response = _SESSION.get(
+                        _TMDB_SEARCH_URLS[search_type],
+                        params={**_TMDB_SEARCH_PARAMS, "query": search_title},
                         timeout=5
                     )
                     
@@ -532,19 +799,29 @@ def find_improved_tmdb_image(title: str, media_type: str, season_number: Optiona
                         results = data["results"]
                         
                         # Score results by relevance to our query
+                        search_lower = search_title.lower()
+                        current_year = time.localtime().tm_year
                         scored_results = []
                         for result in results:
+                            # Only score results with poster paths
+                            if not result.get("poster_path"):
+                                continue
+                            
                             result_title = result.get("title") or result.get("name", "Unknown")
+                            result_lower = result_title.lower()
                             score = 0
                             
-                            # Exact match gets highest score
-                            if result_title.lower() == search_title.lower():
-                                score += 100
+                            # Exact match wins outright, no need to score the rest
+                            if result_lower == search_lower:
+                                poster_path = result["poster_path"]
+                                logger.info(f"Exact match: '{result_title}'")
+                                logger.info(f"Selected poster for '{result_title}': {TMDB_IMG_PREFIX}{poster_path}")
+                                return poster_path
                             # Title contains our search as a substring
-                            elif search_title.lower() in result_title.lower():
+                            elif search_lower in result_lower:
                                 score += 50
                             # Our search contains the result title
-                            elif result_title.lower() in search_title.lower():
+                            elif result_lower in search_lower:
                                 score += 40
                                 
                             # Add popularity as a smaller factor
@@ -555,22 +832,19 @@ def find_improved_tmdb_image(title: str, media_type: str, season_number: Optiona
                                 release_date = result.get("release_date") or result.get("first_air_date")
                                 try:
                                     year = int(release_date[:4])
-                                    current_year = int(time.strftime("%Y"))
                                     # Newer content gets higher score, max bonus of 20 for current year
                                     year_bonus = min(20, max(0, (year - 2000) / (current_year - 2000) * 20))
                                     score += year_bonus
                                 except:
                                     pass
                             
-                            # Only add results with poster paths
-                            if result.get("poster_path"):
-                                scored_results.append((score, result))
+                            scored_results.append((score, result))
                         
-                        # Sort by score, highest first
-                        scored_results.sort(reverse=True, key=lambda x: x[0])
+                        # Only the top three are ever used, so skip sorting the full list
+                        scored_results = heapq.nlargest(3, scored_results, key=lambda x: x[0])
                         
                         # Log the top matches
-                        for score, result in scored_results[:3]:
+                        for score, result in scored_results:
                             result_title = result.get("title") or result.get("name", "Unknown")
                             logger.info(f"Match: '{result_title}' (score: {score:.1f})")
                         
@@ -581,7 +855,7 @@ def find_improved_tmdb_image(title: str, media_type: str, season_number: Optiona
                             poster_path = top_result.get("poster_path")
                             
                             if poster_path:
-                                full_path = f"https://image.tmdb.org/t/p/w200{poster_path}"
+                                full_path = TMDB_IMG_PREFIX + poster_path
                                 logger.info(f"Selected poster for '{result_title}': {full_path}")
                                 return poster_path
                 
@@ -614,12 +888,9 @@ def find_season_image_tmdb(series_title: str, season_number: int) -> Optional[st
         
         # First, find the TV show by title
         try:
-            response = requests.get(
-                f"{TMDB_API_BASE}/search/tv",
-                params={
-                    "api_key": TMDB_API_KEY,
-                    "query": series_title
-                },
+            response = _SESSION.get(
+                _TMDB_TV_URL,
+                params={**_TMDB_API_PARAMS, "query": series_title},
                 timeout=5
             )
             
@@ -639,9 +910,9 @@ def find_season_image_tmdb(series_title: str, season_number: int) -> Optional[st
             logger.info(f"Found TV series: '{show_name}' (ID: {show_id})")
             
             # Now get the season details to find the season poster
-            season_response = requests.get(
+            season_response = _SESSION.get(
                 f"{TMDB_API_BASE}/tv/{show_id}/season/{season_number}",
-                params={"api_key": TMDB_API_KEY},
+                params=_TMDB_API_PARAMS,
                 timeout=5
             )
             
@@ -669,166 +940,214 @@ def find_season_image_tmdb(series_title: str, season_number: int) -> Optional[st
         logger.error(f"Error in season image search: {e}")
         return None
 
+def get_tmdb_cache() -> Optional[sqlite3.Connection]:
+    """Open the on-disk TMDB poster cache, creating it if needed."""
+    global _tmdb_cache_db
+    
+    if _tmdb_cache_db is None:
+        try:
+            _tmdb_cache_db = sqlite3.connect(TMDB_CACHE_FILE, check_same_thread=False)
+            _tmdb_cache_db.execute(
+                "CREATE TABLE IF NOT EXISTS tmdb_images ("
+                "title TEXT NOT NULL, media_type TEXT NOT NULL, season INTEGER NOT NULL, "
+                "poster_path TEXT NOT NULL, fetched_at REAL NOT NULL, "
+                "PRIMARY KEY (title, media_type, season))"
+            )
+            _tmdb_cache_db.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"TMDB cache unavailable, falling back to API only: {e}")
+            _tmdb_cache_db = None
+    return _tmdb_cache_db
+
+@cache_found(maxsize=512)
+def find_cached_tmdb_image(title: str, media_type: str, season_number: Optional[int] = None, episode_number: Optional[int] = None) -> Optional[str]:
+    """TMDB image search backed by an in-memory LRU and the on-disk cache; only found posters are cached."""
+    # Posters are per season at most, so the episode is not part of the key
+    season_key = season_number if season_number is not None else -1
+    db = get_tmdb_cache()
+    
+    if db is not None:
+        try:
+            row = db.execute(
+                "SELECT poster_path, fetched_at FROM tmdb_images WHERE title = ? AND media_type = ? AND season = ?",
+                (title, media_type, season_key)
+            ).fetchone()
+            if row and time.time() - row[1] < TMDB_CACHE_TTL:
+                logger.info(f"Using cached TMDB poster for '{clean_title_for_logging(title)}'")
+                return row[0]
+        except sqlite3.Error as e:
+            logger.warning(f"Error reading TMDB cache: {e}")
+    
+    poster_path = find_improved_tmdb_image(title, media_type, season_number, episode_number)
+    
+    if poster_path and db is not None:
+        try:
+            db.execute(
+                "INSERT OR REPLACE INTO tmdb_images (title, media_type, season, poster_path, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                (title, media_type, season_key, poster_path, time.time())
+            )
+            db.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Error writing TMDB cache: {e}")
+    
+    return poster_path
+
+@functools.lru_cache(maxsize=None)
 def update_readme_with_api_info():
-    """Add information to the console about using TMDB."""
+    """Add information to the console about using TMDB; only the first call per process logs."""
     logger.info("\n===== TMDB IMAGE SEARCH =====")
     logger.info("Using TMDB (The Movie Database) API for thumbnails")
     logger.info("This is a free service with no API key registration needed for this app")
     logger.info("If thumbnails aren't showing correctly, please check your internet connection")
     logger.info("==============================")
 
-def update_presence(media_info: Dict, image_key: Optional[str] = None):
-    """Update Discord rich presence."""
+def _trim(text: str, limit: int = 100) -> str:
+    """Shorten text to Discord's field limit, ending with an ellipsis when cut."""
+    return text if len(text) <= limit else text[:limit - 3] + "..."
+
+def update_presence(media_info: Dict, image_key: Optional[str] = None) -> bool:
+    """Update Discord rich presence; returns True if Discord accepted an update."""
     global start_timestamp, rpc
     
+    service = media_info["service"]
+    media_type = media_info.get("type")
+    season = media_info.get("season")
+    episode = media_info.get("episode")
+    episode_title = media_info.get("episodeTitle")
+    
     # Clean up title for display
-    display_title = clean_title(media_info["title"], media_info["service"])
+    display_title = clean_title(media_info["title"], service)
         
     # Limit title length to avoid Discord API errors
-    if len(display_title) > 100:
-        display_title = display_title[:97] + "..."
+    display_title = _trim(display_title)
     
     # Use static image keys that match what you've uploaded to Discord
-    large_image_key = "netflix" if media_info["service"] == "Netflix" else "disney"
+    large_image_key = SERVICE_IMAGE_KEYS.get(service, "disney")
     
     # Set a default state if none is provided
-    if media_info.get("type") == "show" and media_info.get("season") and media_info.get("episode"):
+    if media_type == "show" and season and episode:
         # Create just 'S1:E1' without any trailing 'on' text
-        state = f"S{media_info['season']}:E{media_info['episode']}"
-        if media_info.get("episodeTitle"):
+        state = f"S{season}:E{episode}"
+        if episode_title:
             # Clean episode title too
-            clean_episode_title = clean_title(media_info['episodeTitle'], media_info["service"])
+            clean_episode_title = clean_title(episode_title, service)
             # Make sure there's no "on" at the end
-            clean_episode_title = re.sub(r'\s+on\s*$', '', clean_episode_title)
-            state += f" - {clean_episode_title}"
+            clean_episode_title = _ON_END_RE.sub('', clean_episode_title)
             # Limit state length
-            if len(state) > 100:
-                state = state[:97] + "..."
+            state = _trim(f"{state} - {clean_episode_title}")
     else:
         # Default state for movies or when episode info is unavailable
         # Keep "Watching on Service" format for movies
-        state = f"Watching on {media_info['service']}"
+        state = f"Watching on {service}"
     
-    # Create simple activity data first - minimal data reduces chance of timeout
+    # Minimal activity data is the fallback if the full update fails
     minimal_activity = {
         "details": display_title,
         "state": state,
         "large_image": large_image_key
     }
-
-    # Update Discord presence using a tiered approach
-    update_successful = False
     
-    # Try the minimal activity first
+    # Build the full activity once so Discord gets a single update
+    full_activity = minimal_activity.copy()
+    full_activity["large_text"] = f"Watching on {service}"
+    
+    if image_key:
+        # Check if it's a full URL or just a path
+        if isinstance(image_key, str) and image_key.startswith('http'):
+            full_activity["small_image"] = image_key
+        else:
+            full_activity["small_image"] = TMDB_IMG_PREFIX + image_key
+        full_activity["small_text"] = display_title
+        logger.info("Using image URL: %s", full_activity['small_image'])
+    
+    service_url = SERVICE_URLS.get(service, "")
+    if service_url:
+        full_activity["buttons"] = [
+            {"label": f"Watch on {service}", "url": service_url}
+        ]
+    
     try:
-        rpc.update(**minimal_activity)
-        logger.info(f"Basic presence update successful: {media_info['service']} - {clean_title_for_logging(display_title)}")
-        update_successful = True
+        rpc.update(**full_activity)
+        logger.info("Full presence update successful: %s - %s", service, display_title)
+        return True
     except Exception as e:
-        logger.warning(f"Basic presence update failed: {e}")
+        logger.warning("Full presence update failed: %s", e)
         
         # Check if it's a timeout error - attempt reconnection first
         if "No response was received from the pipe in time" in str(e):
-            logger.warning("Discord pipe timeout detected. Attempting to reconnect...")
-            if reconnect_discord():
-                # Retry after reconnection
-                try:
-                    rpc.update(**minimal_activity)
-                    logger.info("Presence update successful after reconnection")
-                    update_successful = True
-                except Exception as retry_error:
-                    logger.error(f"Update still failed after reconnection: {retry_error}")
-    
-    # If the basic update was successful and we have an image, try to add it
-    if update_successful and image_key:
-        try:
-            # Wait a moment before adding the image
-            time.sleep(1.0)
-            
-            # Prepare activity with image
-            image_activity = minimal_activity.copy()
-            
-            # Add small image
-            try:
-                # Check if it's a full URL or just a path
-                if isinstance(image_key, str) and image_key.startswith('http'):
-                    image_activity["small_image"] = image_key
-                else:
-                    image_activity["small_image"] = f"https://image.tmdb.org/t/p/w200{image_key}"
-                    
-                image_activity["small_text"] = display_title[:100] if len(display_title) > 100 else display_title
-                logger.info(f"Using image URL: {image_activity['small_image']}")
-                
-                # Update with image
-                rpc.update(**image_activity)
-                logger.info("Presence updated with thumbnail image")
-            except Exception as img_err:
-                logger.error(f"Error setting thumbnail image: {img_err}")
-        except Exception as e:
-            logger.error(f"Error updating presence with image: {e}")
+            logger.warning("Discord pipe timeout detected. Scheduling a reconnect...")
+            schedule_reconnect()
+            return False
     
-    # If everything worked well so far, try to add buttons
-    if update_successful:
-        try:
-            # Wait another moment before adding buttons
-            time.sleep(1.0)
-            
-            # Try to build the URL properly
-            service_url = ""
-            if media_info['service'] == "Netflix":
-                service_url = "https://www.netflix.com"
-            elif media_info['service'] == "Disney+":
-                service_url = "https://www.disneyplus.com"
-            
-            # Create full activity data
-            full_activity = image_activity.copy() if 'image_activity' in locals() else minimal_activity.copy()
-            full_activity["large_text"] = f"Watching on {media_info['service']}"
-            
-            # Only add buttons if supported
-            try:
-                full_activity["buttons"] = [
-                    {"label": f"Watch on {media_info['service']}", "url": service_url}
-                ]
-                
-                rpc.update(**full_activity)
-                logger.info("Full presence updated with buttons")
-            except Exception as button_err:
-                logger.error(f"Error adding buttons to presence: {button_err}")
-        except Exception as e:
-            logger.error(f"Error updating full presence: {e}")
+    # Fall back to the minimal activity with a single retry
+    try:
+        rpc.update(**minimal_activity)
+        logger.info("Basic presence update successful: %s - %s", service, display_title)
+        return True
+    except Exception as e:
+        logger.error("Basic presence update failed: %s", e)
+        return False
+
+def schedule_reconnect():
+    """Schedule a Discord reconnect after an exponential backoff (1s, 2s, 4s... capped) without blocking."""
+    global _reconnect_deadline, _reconnect_failures
+    
+    delay = min(2 ** _reconnect_failures, RECONNECT_MAX_DELAY)
+    _reconnect_failures += 1
+    _reconnect_deadline = time.monotonic() + delay
+    logger.info("Reconnecting to Discord in %s seconds", delay)
+
+def reconnect_pending() -> bool:
+    """Check whether a scheduled Discord reconnect is still waiting out its backoff."""
+    return bool(_reconnect_deadline) and time.monotonic() < _reconnect_deadline
 
 def reconnect_discord():
-    """Reconnect to Discord if connection is lost."""
-    global rpc
+    """Reconnect to Discord if connection is lost; on failure the next attempt is scheduled with backoff."""
+    global rpc, _reconnect_deadline, _reconnect_failures, _last_update_ts, _last_forced_update
+    from pypresence import Presence
+    
+    # Don't hammer Discord while a previous failure is backing off
+    if reconnect_pending():
+        return False
+    
+    # No point connecting while the watchdog sees no Discord process
+    if discord_process_missing():
+        logger.info("Discord is not running, postponing reconnect")
+        schedule_reconnect()
+        return False
     
     try:
         # First try to properly close the connection
-        try:
-            rpc.close()
-        except:
-            pass
-            
-        # Wait a longer moment
-        time.sleep(3)
+        if rpc is not None:
+            try:
+                rpc.close()
+            except:
+                pass
         
         # Attempt to reconnect
         logger.info("Reconnecting to Discord...")
         rpc = Presence(DISCORD_CLIENT_ID)
         rpc.connect()
         logger.info("Successfully reconnected to Discord!")
+        _reconnect_deadline = 0.0
+        _reconnect_failures = 0
+        # The new connection has no presence yet, so the next detection resends it
+        _last_update_ts = 0.0
+        _last_forced_update = 0.0
         return True
         
     except Exception as e:
-        logger.error(f"Failed to reconnect to Discord: {e}")
+        logger.error("Failed to reconnect to Discord: %s", e)
+        schedule_reconnect()
         return False
 
-def check_native_apps() -> Optional[Dict[str, Union[str, bool, int]]]:
+def check_native_apps(windows: Optional[list] = None) -> Optional[Dict[str, Union[str, bool, int]]]:
     """Check if Netflix or Disney+ apps are running and in focus."""
     # Get the active window first for faster checking
     active_window_hwnd = win32gui.GetForegroundWindow()
     active_window_title = win32gui.GetWindowText(active_window_hwnd)
     
-    # Store all streaming apps we find
+    # Store all streaming apps we find; the parsers return fresh dicts, so they are returned as-is
     streaming_apps = []
     
     # Quick check of active window first (faster)
@@ -838,9 +1157,7 @@ def check_native_apps() -> Optional[Dict[str, Union[str, bool, int]]]:
         if media_info:
             media_info["isWatching"] = True
             media_info["service"] = "Netflix"
-            media_info["window_hwnd"] = active_window_hwnd
-            media_info["is_visible"] = True
-            media_info["is_running"] = True
+            media_info["detected_by_system"] = True  # Window title match, trusted like the process scan
             streaming_apps.append(media_info)
     
     # Check for Disney+ in active window
@@ -850,208 +1167,174 @@ def check_native_apps() -> Optional[Dict[str, Union[str, bool, int]]]:
         if media_info:
             media_info["isWatching"] = True
             media_info["service"] = "Disney+"
-            media_info["window_hwnd"] = active_window_hwnd
-            media_info["is_visible"] = True
-            media_info["is_running"] = True
+            media_info["detected_by_system"] = True  # Window title match, trusted like the process scan
             streaming_apps.append(media_info)
     
+    # The active window always wins, so skip enumerating the rest when it matched
+    if streaming_apps:
+        result = streaming_apps[0]
+        logger.info("Selected active app: %s - %s", result['service'], result['title'])
+        return result
+    
     # Now check all windows to detect media apps even if not in focus/visible
-    windows = get_all_windows()
+    if windows is None:
+        windows = get_window_snapshot()
     
-    for hwnd, title, process_name in windows:
+    for hwnd, title in windows:
         # Skip windows we've already processed (the active one)
         if hwnd == active_window_hwnd:
             continue
             
         if not title:
             continue
+        
+        # Find both service names in a single scan and skip unrelated windows early
+        hits = set(_TITLE_MARKER_RE.findall(title))
+        if not hits & _SERVICE_MARKERS:
+            continue
             
         # Ignore certain window titles to avoid false positives
-        if any(ignored in title.lower() for ignored in [".env", "settings", "cursor", "code editor"]):
+        if _NATIVE_IGNORE_RE.search(title):
             continue
             
         # Check Netflix app
-        if NETFLIX_APP_NAME in title:
+        if NETFLIX_APP_NAME in hits:
             # Analyze title to extract show/movie info
             media_info = parse_netflix_title(title)
             if media_info:
                 media_info["isWatching"] = True
                 media_info["service"] = "Netflix"
-                media_info["window_hwnd"] = hwnd
-                media_info["is_visible"] = win32gui.IsWindowVisible(hwnd)
-                media_info["is_running"] = True
+                media_info["detected_by_system"] = True
                 streaming_apps.append(media_info)
                 
         # Check Disney+ app
-        if DISNEY_APP_NAME in title:
+        if DISNEY_APP_NAME in hits:
             # Analyze title to extract show/movie info
             media_info = parse_disney_title(title)
             if media_info:
                 media_info["isWatching"] = True
                 media_info["service"] = "Disney+"
-                media_info["window_hwnd"] = hwnd
-                media_info["is_visible"] = win32gui.IsWindowVisible(hwnd)
-                media_info["is_running"] = True
+                media_info["detected_by_system"] = True
                 streaming_apps.append(media_info)
     
     # If no media apps found
     if not streaming_apps:
         return None
     
-    # IMPORTANT: Modified prioritization logic:
-    # 1. First prefer active window if available
-    # 2. Otherwise, use any streaming app that's found, even if minimized
-    
-    for app in streaming_apps:
-        if app["window_hwnd"] == active_window_hwnd:
-            # Active window gets priority
-            result = app.copy()
-            if "window_hwnd" in result:
-                del result["window_hwnd"]
-            if "is_visible" in result:
-                del result["is_visible"]
-            if "is_running" in result:
-                del result["is_running"]
-            logger.info(f"Selected active app: {result['service']} - {result['title']}")
-            return result
-    
     # No active window, just use the first one found (even if minimized)
-    result = streaming_apps[0].copy()
-    if "window_hwnd" in result:
-        del result["window_hwnd"]
-    if "is_visible" in result:
-        del result["is_visible"]
-    if "is_running" in result:
-        del result["is_running"]
-    logger.info(f"Selected background app: {result['service']} - {result['title']}")
+    result = streaming_apps[0]
+    logger.info("Selected background app: %s - %s", result['service'], result['title'])
     return result
 
-def check_system_processes() -> Optional[Dict[str, Union[str, bool, int]]]:
+def get_process_cmdline(proc: "psutil.Process") -> str:
+    """Read a process command line lazily, lowercased; empty if it is not accessible."""
+    import psutil
+    try:
+        cmd_line = proc.cmdline()
+    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+        return ""
+    return " ".join(cmd_line).lower() if cmd_line else ""
+
+def system_process_media(service: str, window_titles: list, parse_title) -> Dict[str, Union[str, bool, int]]:
+    """Build media info for a streaming app found by the process scan, parsing its window title if there is one."""
+    # If we found a window title, parse it for content details
+    if window_titles:
+        media_info = parse_title(window_titles[0])
+        if media_info:
+            media_info["isWatching"] = True
+            media_info["service"] = service
+            media_info["detected_by_system"] = True  # Mark as detected by system
+            logger.info("%s content detected from window: %s", service, media_info.get('title', 'Unknown'))
+            return media_info
+    
+    # If we didn't find details but we're sure the app is running, return generic info
+    logger.info("%s process confirmed, returning generic info", service)
+    return {
+        "isWatching": True,
+        "service": service,
+        "title": f"{service} Content",
+        "type": "unknown",
+        "detected_by_system": True  # Mark as detected by system
+    }
+
+def check_system_processes(windows: Optional[list] = None) -> Optional[Dict[str, Union[str, bool, int]]]:
     """Check running processes to find Netflix or Disney+ apps even if minimized."""
-    logger.debug("Checking system processes for streaming apps")
+    import psutil
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        logger.debug("Checking system processes for streaming apps")
     
     try:
-        all_processes = list(psutil.process_iter(['pid', 'name', 'cmdline']))
+        # Bucket processes by lowercased name in a single pass
+        procs_by_name = {}
+        for proc in get_process_snapshot():
+            procs_by_name.setdefault((proc.info.get('name') or "").lower(), []).append(proc)
         
-        # Look for Disney+ processes - checking multiple possible process names
-        disney_process_names = ["Disney+.exe", "WWAHost.exe", "ApplicationFrameHost.exe", "explorer.exe"]
-        netflix_process_names = ["Netflix.exe", "WWAHost.exe", "ApplicationFrameHost.exe"]
-
-        # First, specifically check for Disney+ as it's causing the issue
-        for proc in all_processes:
-            try:
-                proc_name = proc.info['name'] if proc.info.get('name') else ""
-                cmd_line = proc.info.get('cmdline', [])
-                cmd_str = " ".join(cmd_line).lower() if cmd_line else ""
-                
-                # Look for process names that might be hosting Disney+
-                if any(proc_name.lower() == disney_proc.lower() for disney_proc in disney_process_names):
-                    logger.info(f"Found potential Disney+ process: {proc_name}")
-                    
-                    # For ApplicationFrameHost or other generic hosts, check command line or window titles
-                    if proc_name.lower() in ["applicationframehost.exe", "wwahost.exe", "explorer.exe"]:
-                        # Check if Disney+ is in the command line
-                        if not any(disney_term in cmd_str.lower() for disney_term in ["disney", "disneyplus"]):
-                            # If not in command line, check all windows to see if there's a Disney+ window
-                            has_disney_window = False
-                            for hwnd, title, _ in get_all_windows():
-                                if DISNEY_APP_NAME in title:
-                                    has_disney_window = True
-                                    logger.info(f"Found Disney+ window: {clean_title_for_logging(title)}")
-                                    # Parse the window title for details
-                                    media_info = parse_disney_title(title)
-                                    if media_info:
-                                        media_info["isWatching"] = True
-                                        media_info["service"] = "Disney+"
-                                        media_info["detected_by_system"] = True  # Mark as detected by system
-                                        logger.info(f"Disney+ content detected: {clean_title_for_logging(media_info.get('title', 'Unknown'))}")
-                                        return media_info
-                                    break
-                            
-                            if not has_disney_window:
-                                # No Disney+ window found for this process
-                                continue
-                    
-                    # If we reached here, we likely have a Disney+ process
-                    # Try to find its window
-                    window_title = ""
-                    for hwnd, title, _ in get_all_windows():
-                        if DISNEY_APP_NAME in title:
-                            window_title = title
-                            break
-                    
-                    # If we found a window title, parse it for content details
-                    if window_title:
-                        media_info = parse_disney_title(window_title)
-                        if media_info:
-                            media_info["isWatching"] = True
-                            media_info["service"] = "Disney+"
-                            media_info["detected_by_system"] = True  # Mark as detected by system
-                            logger.info(f"Disney+ content detected from window: {clean_title_for_logging(media_info.get('title', 'Unknown'))}")
-                            return media_info
-                    
-                    # If we didn't find details but we're sure Disney+ is running, return generic info
-                    logger.info("Disney+ process confirmed, returning generic info")
-                    return {
-                        "isWatching": True,
-                        "service": "Disney+",
-                        "title": "Disney+ Content",
-                        "type": "unknown",
-                        "detected_by_system": True  # Mark as detected by system
-                    }
-            
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess) as e:
-                logger.debug(f"Process access error: {str(e)}")
-                continue
-            except Exception as e:
-                logger.error(f"Unexpected error processing Disney+: {str(e)}")
+        # Enumerate windows once and pick out the streaming app titles up front,
+        # scanning each title a single time for service names and multi-tab markers
+        if windows is None:
+            windows = get_window_snapshot()
+        disney_titles = []
+        netflix_titles = []
+        tab_titles = []
+        for _, title in windows:
+            hits = set(_TITLE_MARKER_RE.findall(title))
+            if not hits:
                 continue
+            if DISNEY_APP_NAME in hits:
+                disney_titles.append(title)
+            if NETFLIX_APP_NAME in hits:
+                netflix_titles.append(title)
+            if hits & _SERVICE_MARKERS and hits & _MULTI_TAB_MARKERS:
+                tab_titles.append((title, hits))
         
-        # Now check for Netflix processes (same approach as Disney+)
-        for proc in all_processes:
-            try:
-                proc_name = proc.info['name'] if proc.info.get('name') else ""
-                cmd_line = proc.info.get('cmdline', [])
-                cmd_str = " ".join(cmd_line).lower() if cmd_line else ""
-                
-                if any(proc_name.lower() == netflix_proc.lower() for netflix_proc in netflix_process_names):
-                    logger.info(f"Found potential Netflix process: {proc_name}")
+        # Single pass over the candidate host processes; Disney+ is checked first as it's
+        # causing the issue, so a Disney+ match returns at once while Netflix is kept as a fallback
+        netflix_confirmed = False
+        for proc_name_l in (DISNEY_PROC_NAMES | NETFLIX_PROC_NAMES) & procs_by_name.keys():
+            is_generic_host = proc_name_l in GENERIC_HOST_PROC_NAMES
+            for proc in procs_by_name[proc_name_l]:
+                try:
+                    proc_name = proc.info.get('name') or ""
                     
-                    # For generic hosts, check command line or window titles
-                    if proc_name.lower() in ["applicationframehost.exe", "wwahost.exe"]:
-                        if not any(netflix_term in cmd_str.lower() for netflix_term in ["netflix"]):
-                            # Check windows for Netflix titles
-                            has_netflix_window = False
-                            for hwnd, title, _ in get_all_windows():
-                                if NETFLIX_APP_NAME in title:
-                                    has_netflix_window = True
-                                    media_info = parse_netflix_title(title)
-                                    if media_info:
-                                        media_info["isWatching"] = True
-                                        media_info["service"] = "Netflix"
-                                        media_info["detected_by_system"] = True
-                                        return media_info
-                                    break
-                                    
-                            if not has_netflix_window:
-                                continue
+                    # Only generic hosts need their command line, read once for both services
+                    cmd_str = get_process_cmdline(proc) if is_generic_host else ""
                     
-                    # Try to find Netflix window
-                    window_title = ""
-                    for hwnd, title, _ in get_all_windows():
-                        if NETFLIX_APP_NAME in title:
-                            window_title = title
-                            break
+                    # Generic hosts only count if the command line or a window mentions the service
+                    if proc_name_l in DISNEY_PROC_NAMES:
+                        logger.info("Found potential Disney+ process: %s", proc_name)
+                        if not is_generic_host or "disney" in cmd_str or disney_titles:
+                            return system_process_media("Disney+", disney_titles, parse_disney_title)
                     
-                    if window_title:
-                        media_info = parse_netflix_title(window_title)
-                        if media_info:
-                            media_info["isWatching"] = True
-                            media_info["service"] = "Netflix"
-                            media_info["detected_by_system"] = True
-                            return media_info
+                    if proc_name_l in NETFLIX_PROC_NAMES and not netflix_confirmed:
+                        logger.info("Found potential Netflix process: %s", proc_name)
+                        if not is_generic_host or "netflix" in cmd_str or netflix_titles:
+                            netflix_confirmed = True
+                
+                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess) as e:
+                    if debug_enabled:
+                        logger.debug("Process access error: %s", e)
+                    continue
+                except Exception as e:
+                    logger.error("Unexpected error processing %s: %s", proc_name_l, e)
+                    continue
+        
+        if netflix_confirmed:
+            return system_process_media("Netflix", netflix_titles, parse_netflix_title)
+
+        # Additional check for browser tabs with "Netflix" or "Disney+" in the title
+        # that also contain "and x more pages" which indicates multiple browser tabs
+        for title, hits in tab_titles:
+            try:
+                # Titles here already matched a service name plus a multi-tab marker
+                # This is likely a browser with multiple tabs, one of which has streaming content
+                # But we need to filter out specific false positives (readme files, etc)
+                if _TAB_FALSE_POSITIVE_RE.search(title):
+                    logger.info("Skipping false positive browser tab: %s", title)
+                    continue
                     
-                    # Generic Netflix info
+                if NETFLIX_APP_NAME in hits:
+                    logger.info("Found browser with Netflix tab: %s", title)
                     return {
                         "isWatching": True,
                         "service": "Netflix",
@@ -1059,210 +1342,170 @@ def check_system_processes() -> Optional[Dict[str, Union[str, bool, int]]]:
                         "type": "unknown",
                         "detected_by_system": True
                     }
-            
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                continue
-            except Exception as e:
-                logger.error(f"Unexpected error processing Netflix: {str(e)}")
-                continue
-
-        # Additional check for browser tabs with "Netflix" or "Disney+" in the title
-        # that also contain "and x more pages" which indicates multiple browser tabs
-        for hwnd, title, process_name in get_all_windows():
-            try:
-                if not title:
-                    continue
-                    
-                # Safe logging
-                safe_title = clean_title_for_logging(title)
-                
-                # Check for browser patterns that indicate streaming in a tab
-                if (("Netflix" in title or "Disney+" in title) and 
-                    any(pattern in title for pattern in ["more pages", "more tab", "and tab"])):
-                    
-                    # This is likely a browser with multiple tabs, one of which has streaming content
-                    # But we need to filter out specific false positives (readme files, etc)
-                    if any(pattern in title.lower() for pattern in [
-                        "readme", ".md", "documentation", "github", 
-                        "developer", "programming", "code", 
-                        "disney + & netflix"  # This is your project name
-                    ]):
-                        logger.info(f"Skipping false positive browser tab: {safe_title}")
-                        continue
-                        
-                    if "Netflix" in title:
-                        logger.info(f"Found browser with Netflix tab: {safe_title}")
-                        return {
-                            "isWatching": True,
-                            "service": "Netflix",
-                            "title": "Netflix Content",
-                            "type": "unknown",
-                            "detected_by_system": True
-                        }
-                    elif "Disney+" in title:
-                        logger.info(f"Found browser with Disney+ tab: {safe_title}")
-                        return {
-                            "isWatching": True,
-                            "service": "Disney+",
-                            "title": "Disney+ Content",
-                            "type": "unknown",
-                            "detected_by_system": True
-                        }
+                elif DISNEY_APP_NAME in hits:
+                    logger.info("Found browser with Disney+ tab: %s", title)
+                    return {
+                        "isWatching": True,
+                        "service": "Disney+",
+                        "title": "Disney+ Content",
+                        "type": "unknown",
+                        "detected_by_system": True
+                    }
             except Exception as e:
-                logger.error(f"Error checking browser tab: {str(e)}")
+                logger.error("Error checking browser tab: %s", e)
                 continue
         
         # No streaming apps found
         return None
         
     except Exception as e:
-        logger.error(f"Error checking system processes: {str(e)}")
+        logger.error("Error checking system processes: %s", e)
         return None
 
 def detect_media():
     """Detect media being watched."""
-    global current_media, start_timestamp, rpc
+    global current_media, start_timestamp, rpc, _last_update_ts, _last_forced_update
+    from pypresence import Presence
     
-    logger.debug("Checking for media...")
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        logger.debug("Checking for media...")
     
-    # CHANGE ORDER - start with system processes check first which is most reliable
-    # First check system processes (most thorough)
-    media_info = check_system_processes()
+    # Run a scheduled reconnect once its backoff has passed; until then leave Discord alone
+    discord_paused = reconnect_pending()
+    if _reconnect_deadline and not discord_paused:
+        discord_paused = not reconnect_discord()
     
-    # If not found in system processes, check native apps
-    if not media_info:
-        media_info = check_native_apps()
+    # Cheapest checks first: native app windows can answer from the foreground window alone,
+    # and windows are only enumerated (once, shared via the snapshot) when it doesn't
+    media_info = check_native_apps()
     
-    # If still not found, check browsers
+    # If not found in native apps, check browsers
     if not media_info:
         media_info = check_browser_tabs()
     
+    # Fall back to the process scan (most thorough, but walks every process)
+    if not media_info:
+        media_info = check_system_processes()
+    
     # If still not found, return not watching
     if not media_info:
         media_info = {"isWatching": False}
     
+    # Bind the fields used below once; the title is lowercased for every filter
+    is_watching = media_info.get("isWatching", False)
+    title_l = media_info.get("title", "").lower()
+    detected_by_system = media_info.get("detected_by_system", False)
+    
     # NEW: Super aggressive filtering for readme.md and documentation
-    if media_info.get("isWatching", False):
-        title = media_info.get("title", "").lower()
-        service = media_info.get("service", "")
-        
+    if is_watching:
         # Specifically check for readme.md in the title
-        if "readme" in title or ".md" in title or "documentation" in title:
-            logger.info(f"Detected documentation file ({title}), not a valid streaming media. Clearing presence.")
-            media_info = {"isWatching": False}
+        if _DOC_TITLE_RE.search(title_l):
+            logger.info("Detected documentation file (%s), not a valid streaming media. Clearing presence.", title_l)
+            is_watching = False
         
         # Also check for repo names and project folders that might contain "netflix" or "disney"
-        elif any(term in title for term in ["repo", "repository", "project", "folder", "file", "code", "github"]):
-            logger.info(f"Detected development-related content ({title}), not streaming media. Clearing presence.")
-            media_info = {"isWatching": False}
+        elif _DEV_CONTENT_RE.search(title_l):
+            logger.info("Detected development-related content (%s), not streaming media. Clearing presence.", title_l)
+            is_watching = False
             
         # Check for our specific "readme.md - Disney + & Netflix" document
-        elif "disney + & netflix" in title or "streaming" in title:
-            logger.info(f"Detected project documentation ({title}), not streaming media. Clearing presence.")
-            media_info = {"isWatching": False}
+        elif _PROJECT_DOC_RE.search(title_l):
+            logger.info("Detected project documentation (%s), not streaming media. Clearing presence.", title_l)
+            is_watching = False
             
         # Filter out titles that look like program names
-        elif len(title) < 5 and not media_info.get("detected_by_system", False):
-            logger.info(f"Title '{title}' too short, likely not valid media. Clearing presence.")
-            media_info = {"isWatching": False}
+        elif len(title_l) < 5 and not detected_by_system:
+            logger.info("Title '%s' too short, likely not valid media. Clearing presence.", title_l)
+            is_watching = False
     
     # If not watching anything, clear presence
     # IMPORTANT: Only clear if we've confirmed no media is playing anywhere
-    if not media_info.get("isWatching", False):
+    if not is_watching:
         if current_media:
             logger.info("No longer watching media, clearing presence")
             current_media = None
             try:
                 # Only try to clear if Discord is connected
-                if 'rpc' in globals() and rpc:
+                if rpc is not None and not discord_paused:
                     rpc.clear()
                     logger.info("Discord presence cleared successfully")
             except Exception as e:
-                logger.error(f"Error clearing presence: {e}")
+                logger.error("Error clearing presence: %s", e)
         return
     
     # Filter out false positives - ONLY exclude if not from our system_processes check
     # If it was detected by our system process check, trust it completely
-    title = media_info.get("title", "").lower()
-    detected_by_system = media_info.get("detected_by_system", False)
-    
     # Skip false positive check if detected by system check
     if not detected_by_system:
-        # Improved false positive list with more patterns
-        ignore_patterns = [
-            ".env", "settings", "config", "cursor", "visual studio", "vscode", 
-            "code editor", "discord", "settings.json", "explorer", "file", "folder",
-            "cmd", "command", "powershell", "terminal", "python", "readme", "github",
-            ".md", "markdown", "documentation", "notepad", "editor", "setting", 
-            "preference", "profile", "account", "login", "sign in", "guide", "tutorial",
-            "help", "support", "download", "upload", "install", "setup", "configure",
-            "json", "xml", "yaml", "ini", "conf", "log", "txt", "text", "document",
-            "license", "copyright", "about", "information", "readme.md", "cursor",
-            "disney + & netflix", "streaming", "presence", "rich presence", "discord presence"
-        ]
-        
         # Skip if the title contains any ignored patterns
-        if any(pattern.lower() in title for pattern in ignore_patterns):
-            logger.info(f"Ignoring false positive: {title}")
+        if _IGNORE_RE.search(title_l):
+            logger.info("Ignoring false positive: %s", title_l)
             if current_media:
                 logger.info("Cleared presence due to false positive detection")
                 current_media = None
                 try:
                     # Only try to clear if Discord is connected
-                    if 'rpc' in globals() and rpc:
+                    if rpc is not None and not discord_paused:
                         rpc.clear()
                         logger.info("Discord presence cleared successfully")
                 except Exception as e:
-                    logger.error(f"Error clearing presence: {e}")
+                    logger.error("Error clearing presence: %s", e)
             return
     else:
         logger.info("Media detected by system process check, bypassing false positive filter")
     
+    service = media_info["service"]
+    title = media_info["title"]
+    
     # Check if the service has changed which requires reconnecting with a different client ID
     service_changed = (current_media and 
-                      current_media.get("service") != media_info.get("service"))
+                      current_media.get("service") != service)
     
     # Track time since last update to force periodic updates
     current_time = int(time.time())
-    force_update = False
     
-    # Force an update every 3 minutes (180 seconds) even if media hasn't changed
+    # Compare a stable content key so unchanged media never touches Discord or TMDB
+    media_key = (service, title, media_info.get("season"), media_info.get("episode"))
+    current_key = (current_media["service"], current_media["title"], current_media.get("season"), current_media.get("episode")) if current_media else None
+    media_changed = media_key != current_key
+    
+    # Force an update every 3 minutes even if media hasn't changed
     # This helps ensure Discord presence stays visible
-    if start_timestamp and (current_time - start_timestamp) % 180 < 5:
-        force_update = True
+    # Attempts are spaced by the interval too, so a failing update isn't retried every poll
+    force_update = (not media_changed
+                    and current_time - _last_update_ts >= FORCE_UPDATE_INTERVAL
+                    and current_time - _last_forced_update >= FORCE_UPDATE_INTERVAL)
+    if force_update:
+        _last_forced_update = current_time
         logger.info("Forcing presence update to keep status visible")
     
     # If media has changed or this is a new session, update presence
-    if (not current_media or 
-        media_info["service"] != current_media["service"] or 
-        media_info["title"] != current_media["title"] or 
-        media_info.get("episode") != current_media.get("episode") or
-        media_info.get("season") != current_media.get("season") or
-        force_update):
+    if media_changed or force_update:
         
-        logger.info(f"Media changed or update forced: {media_info['service']} - {media_info['title']}")
+        logger.info("Media changed or update forced: %s - %s", service, title)
         
         # Only reset timestamp if media actually changed (not on forced updates)
         if not force_update or not start_timestamp:
             start_timestamp = current_time
         
         # If the service has changed or we're not connected, we need to reconnect with the appropriate client ID
-        if service_changed or not ('rpc' in globals() and rpc):
+        if (service_changed or rpc is None) and not discord_paused:
             # Close existing connection if there is one
-            if 'rpc' in globals() and rpc:
+            if rpc is not None:
                 try:
                     rpc.clear()
                     rpc.close()
                     logger.info("Closed existing Discord connection")
                 except Exception as e:
-                    logger.error(f"Error closing Discord connection: {e}")
+                    logger.error("Error closing Discord connection: %s", e)
             
             # Select the appropriate client ID based on the service
             client_id = DISCORD_CLIENT_ID
-            if media_info["service"] == "Disney+":
+            if service == "Disney+":
                 client_id = DISNEY_CLIENT_ID
                 logger.info("Using Disney+ client ID for Discord connection")
-            elif media_info["service"] == "Netflix":
+            elif service == "Netflix":
                 client_id = NETFLIX_CLIENT_ID
                 logger.info("Using Netflix client ID for Discord connection")
             
@@ -1270,14 +1513,14 @@ def detect_media():
             try:
                 rpc = Presence(client_id)
                 rpc.connect()
-                logger.info(f"Connected to Discord with {media_info['service']} client ID")
+                logger.info("Connected to Discord with %s client ID", service)
             except Exception as e:
-                logger.error(f"Failed to connect to Discord: {e}")
+                logger.error("Failed to connect to Discord: %s", e)
         
-        current_media = media_info.copy()  # Create a copy to avoid reference issues
+        current_media = media_info  # Detection builds a fresh dict every poll, so no copy is needed
         
         # Don't try to update Discord if it's not connected
-        if not ('rpc' in globals() and rpc):
+        if rpc is None or discord_paused:
             logger.info("Media detected but Discord is not connected - skipping presence update")
             return
             
@@ -1285,95 +1528,179 @@ def detect_media():
         image_key = find_media_image(media_info)
         
         # Update Discord rich presence
-        update_presence(media_info, image_key)
-    else:
-        logger.debug(f"Still watching: {current_media['service']} - {current_media['title']}")
+        if update_presence(media_info, image_key):
+            _last_update_ts = time.time()
+    elif debug_enabled:
+        logger.debug("Still watching: %s - %s", current_media['service'], current_media['title'])
+
+@functools.lru_cache(maxsize=None)
+def _require_env():
+    """Exit if a required environment variable is missing; the check runs once per process."""
+    missing = [name for name, value in (("DISCORD_CLIENT_ID", DISCORD_CLIENT_ID), ("TMDB_API_KEY", TMDB_API_KEY)) if not value]
+    if missing:
+        # Report every missing variable in one error block
+        logger.error("%s not set in .env file", ", ".join(missing))
+        logger.error("Create a .env file with your Discord Client ID and TMDB API key (see readme.md for instructions)")
+        sys.exit(1)
+
+def request_shutdown(signum=None, frame=None):
+    """Signal handler that asks the main loop to stop; returns immediately."""
+    shutdown_event.set()
+    # A second Ctrl+C raises KeyboardInterrupt again, in case the worker is stuck in a slow request
+    signal.signal(signal.SIGINT, signal.default_int_handler)
 
 def main():
     """Main function to run the Discord Rich Presence."""
     logger.info("Starting Discord Rich Presence for Egbot & Chill 🍕🍿")
     
     # Check if environment variables are set
-    if not DISCORD_CLIENT_ID:
-        logger.error("DISCORD_CLIENT_ID not set in .env file")
-        logger.error("Create a .env file with your Discord Client ID and TMDB API key")
-        logger.error("See readme.md for instructions")
-        sys.exit(1)
-    
-    if not TMDB_API_KEY:
-        logger.error("TMDB_API_KEY not set in .env file")
-        logger.error("Create a .env file with your Discord Client ID and TMDB API key")
-        logger.error("See readme.md for instructions")
-        sys.exit(1)
+    _require_env()
         
     # Display available and missing API keys to help user enhance thumbnails
     update_readme_with_api_info()
 
-    # Initialize Discord RPC - this might fail but we'll continue running
-    discord_connected = connect_to_discord()
-    if not discord_connected:
-        logger.warning("Starting in offline mode: Media detection active but Discord status won't update")
+    # Ctrl+C sets shutdown_event instead of raising wherever the main thread happens to be
+    signal.signal(signal.SIGINT, request_shutdown)
     
     # Main loop
     try:
-        # Initial detection frequency variables
-        current_interval = 5  # Start with a 5-second interval
-        consecutive_no_media = 0
-        consecutive_errors = 0
-        
-        while True:
-            try:
-                detect_media()
-                consecutive_errors = 0  # Reset error counter on success
-                
-                # Adaptive detection frequency
-                if current_media:
-                    # When watching something, check every 5 seconds
-                    consecutive_no_media = 0
-                    current_interval = 5
-                else:
-                    # When not watching, gradually increase the interval
-                    consecutive_no_media += 1
-                    if consecutive_no_media > 5:  # After 5 checks with no media
-                        current_interval = 15  # Check every 15 seconds
-                    if consecutive_no_media > 20:  # After 20 checks
-                        current_interval = 30  # Check every 30 seconds
-                
-            except Exception as e:
-                consecutive_errors += 1
-                logger.error(f"Error in detection cycle: {e}")
-                
-                # If we have multiple consecutive errors and Discord was previously connected, try reconnecting
-                if consecutive_errors >= 3 and discord_connected:
-                    logger.warning("Multiple consecutive errors detected. Attempting to reconnect...")
-                    discord_connected = reconnect_discord()
-                    consecutive_errors = 0  # Reset counter after reconnect attempt
-            
-            time.sleep(current_interval)
-            
-    except KeyboardInterrupt:
-        logger.info("Shutting down due to keyboard interrupt...")
+        asyncio.run(main_async())
     except Exception as e:
         logger.error(f"Error in main loop: {e}")
     finally:
         # Let the atexit handler handle cleanup
         pass
 
+async def main_async():
+    """Schedule media polls and Discord heartbeats on the event loop, running the blocking work on the worker thread."""
+    loop = asyncio.get_running_loop()
+    
+    # Initialize Discord RPC - this might fail but we'll continue running
+    discord_connected = await loop.run_in_executor(_WORKER, connect_to_discord)
+    if not discord_connected:
+        logger.warning("Starting in offline mode: Media detection active but Discord status won't update")
+    
+    # Initial detection frequency variables
+    current_interval = MIN_INTERVAL
+    consecutive_errors = 0
+    # Hold references to scheduled tasks so they aren't garbage collected mid-run
+    tasks = set()
+    
+    def spawn(job):
+        task = loop.create_task(job())
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+    
+    async def poll():
+        nonlocal current_interval, consecutive_errors, discord_connected
+        try:
+            await loop.run_in_executor(_WORKER, detect_media)
+            consecutive_errors = 0  # Reset error counter on success
+            
+            # Adaptive detection frequency
+            if current_media:
+                # When watching something, poll at the fastest rate
+                current_interval = MIN_INTERVAL
+            else:
+                # When not watching, double the interval up to the idle cap
+                current_interval = min(current_interval * 2, MAX_INTERVAL)
+            
+        except Exception as e:
+            consecutive_errors += 1
+            logger.error(f"Error in detection cycle: {e}")
+            
+            # Back off while detection keeps failing
+            current_interval = min(current_interval * 1.5, ERROR_MAX_INTERVAL)
+            
+            # If we have multiple consecutive errors and Discord was previously connected, try reconnecting
+            if consecutive_errors >= 3 and discord_connected:
+                logger.warning("Multiple consecutive errors detected. Attempting to reconnect...")
+                discord_connected = await loop.run_in_executor(_WORKER, reconnect_discord)
+                consecutive_errors = 0  # Reset counter after reconnect attempt
+        
+        # Jitter the next poll so it doesn't line up with other periodic work
+        loop.call_later(current_interval * random.uniform(1 - POLL_JITTER, 1 + POLL_JITTER), spawn, poll)
+    
+    async def heartbeat():
+        nonlocal discord_connected
+        # Retry a dropped connection once its backoff expires instead of waiting for the next (possibly idle) poll
+        if _reconnect_deadline and not reconnect_pending():
+            discord_connected = await loop.run_in_executor(_WORKER, reconnect_discord)
+        loop.call_later(HEARTBEAT_INTERVAL, spawn, heartbeat)
+    
+    spawn(poll)
+    loop.call_later(HEARTBEAT_INTERVAL, spawn, heartbeat)
+    
+    # Everything runs from scheduled callbacks; wait here until shutdown is requested
+    try:
+        await loop.run_in_executor(None, shutdown_event.wait)
+        logger.info("Shutting down... (press Ctrl+C again to force quit)")
+    finally:
+        # Release the waiting thread and the watchdog however we got here
+        shutdown_event.set()
+
+def is_discord_running() -> bool:
+    """Check whether any Discord process is running, stopping at the first match."""
+    # Reuse the detection cycle's process list while it is fresh
+    taken_at, processes = _process_snapshot
+    if time.monotonic() - taken_at < PROCESS_SNAPSHOT_TTL:
+        return any('discord' in (proc.info['name'] or "").lower() for proc in processes)
+    
+    snapshot = _kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if not snapshot or snapshot == INVALID_HANDLE_VALUE:
+        # Fall back to psutil if the snapshot can't be taken
+        return any('discord' in (proc.info['name'] or "").lower() for proc in get_process_snapshot())
+    
+    try:
+        # Walk the snapshot's executable names directly
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+        found = _kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while found:
+            if 'discord' in entry.szExeFile.lower():
+                return True
+            found = _kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+        return False
+    finally:
+        _kernel32.CloseHandle(snapshot)
+
+def watch_discord_process():
+    """Refresh discord_running_event from the process list every DISCORD_WATCH_INTERVAL seconds."""
+    while not shutdown_event.wait(DISCORD_WATCH_INTERVAL):
+        try:
+            if is_discord_running():
+                discord_running_event.set()
+            else:
+                discord_running_event.clear()
+        except Exception as e:
+            logger.error(f"Error checking for Discord process: {e}")
+
+def start_discord_watchdog():
+    """Check for Discord once and start the background watchdog, if it isn't running yet."""
+    global _discord_watchdog
+    
+    if _discord_watchdog is not None:
+        return
+    if is_discord_running():
+        discord_running_event.set()
+    _discord_watchdog = threading.Thread(target=watch_discord_process, name="discord-watchdog", daemon=True)
+    _discord_watchdog.start()
+
+def discord_process_missing() -> bool:
+    """Check whether the watchdog has seen Discord exit; always False before the watchdog starts."""
+    return _discord_watchdog is not None and not discord_running_event.is_set()
+
 def connect_to_discord():
     """Connect to Discord with retry logic."""
     global rpc
+    from pypresence import Presence
     
     max_retries = 5
     retry_count = 0
     
-    # Check if Discord is running first
-    discord_running = False
-    for proc in psutil.process_iter(['name']):
-        if 'discord' in proc.info['name'].lower():
-            discord_running = True
-            break
-    
-    if not discord_running:
+    # Check if Discord is running first; the watchdog keeps the answer current for reconnects
+    start_discord_watchdog()
+    if not discord_running_event.is_set():
         logger.error("Discord does not appear to be running. Please start Discord and try again.")
         logger.info("The application will keep running but won't update your Discord status")
         return False
@@ -1410,9 +1737,11 @@ def connect_to_discord():
                 logger.error(f"Failed to connect to Discord (attempt {retry_count}/{max_retries}): {error_message}")
             
             if retry_count < max_retries:
-                wait_time = 2 ** retry_count  # Exponential backoff
-                logger.info(f"Retrying in {wait_time} seconds...")
-                time.sleep(wait_time)
+                # Exponential backoff with a small base: quick retries while Discord starts, capped for longer outages
+                wait_time = min(RETRY_BACKOFF_MIN * RETRY_BACKOFF_BASE ** (retry_count - 1), RETRY_BACKOFF_MAX)
+                logger.info(f"Retrying in {wait_time:.1f} seconds...")
+                if shutdown_event.wait(wait_time):
+                    return False
             else:
                 logger.error("Maximum retry attempts reached.")
                 logger.error("The application will continue running but won't update your Discord status.")
@@ -1427,55 +1756,53 @@ def connect_to_discord():
 def safe_cleanup():
     """Safe cleanup function for when program exits."""
     logger.info("Performing safe cleanup...")
-    try:
-        if 'rpc' in globals() and rpc:
-            logger.info("Closing Discord connection...")
-            try:
-                rpc.clear()
-                time.sleep(0.5)
-                rpc.close()
-            except Exception as e:
-                logger.error(f"Error during Discord cleanup: {e}")
-    except Exception as e:
-        logger.error(f"Error during cleanup: {e}")
+    if rpc is not None:
+        logger.info("Closing Discord connection...")
+        try:
+            rpc.clear()
+            rpc.close()
+        except Exception as e:
+            logger.error(f"Error during Discord cleanup: {e}")
     logger.info("Cleanup complete. Exiting.")
 
 # Register the cleanup function
 atexit.register(safe_cleanup)
 
+def test_mode():
+    """Send a fixed test presence to Discord and keep it up until interrupted."""
+    global rpc, start_timestamp
+    from pypresence import Presence
+    
+    logger.info("Running in TEST MODE")
+    # Initialize Discord RPC
+    try:
+        rpc = Presence(DISCORD_CLIENT_ID)
+        rpc.connect()
+        logger.info("Discord RPC connected successfully!")
+        
+        # Test presence with Netflix
+        start_timestamp = int(time.time())
+        update_presence(TEST_MEDIA)
+        
+        logger.info("Test presence sent! Check your Discord status.")
+        logger.info("Press Ctrl+C to exit.")
+        
+        # Keep the script running until Ctrl+C
+        asyncio.run(hold_test_presence())
+            
+    except Exception as e:
+        logger.error(f"Test mode error: {e}")
+
+async def hold_test_presence():
+    """Idle on the event loop so the test presence stays up without pinning the thread."""
+    while True:
+        await asyncio.sleep(10)
+
 if __name__ == "__main__":
     try:
         # Check for test mode
         if len(sys.argv) > 1 and sys.argv[1] == "--test":
-            logger.info("Running in TEST MODE")
-            # Initialize Discord RPC
-            try:
-                rpc = Presence(DISCORD_CLIENT_ID)
-                rpc.connect()
-                logger.info("Discord RPC connected successfully!")
-                
-                # Test presence with Netflix
-                test_media = {
-                    "isWatching": True,
-                    "service": "Netflix",
-                    "title": "Test Show",
-                    "type": "show",
-                    "season": 1,
-                    "episode": 1
-                }
-                
-                start_timestamp = int(time.time())
-                update_presence(test_media)
-                
-                logger.info("Test presence sent! Check your Discord status.")
-                logger.info("Press Ctrl+C to exit.")
-                
-                # Keep the script running
-                while True:
-                    time.sleep(10)
-                    
-            except Exception as e:
-                logger.error(f"Test mode error: {e}")
+            test_mode()
         else:
             main()
     except KeyboardInterrupt:
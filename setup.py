@@ -2,12 +2,19 @@ import os
 import sys
 import subprocess
 import shutil
+from pathlib import Path
+
+# Placeholder .env written when no .env.example is available
+DEFAULT_ENV = (
+    "DISCORD_CLIENT_ID=your_discord_application_id_here\n"
+    "TMDB_API_KEY=your_tmdb_api_key_here\n"
+)
 
 def check_python_version():
     """Check if the Python version is compatible."""
     print("Checking Python version...")
     version = sys.version_info
-    if version.major < 3 or (version.major == 3 and version.minor < 7):
+    if version < (3, 7):
         print(f"Error: Python 3.7+ is required. You have Python {version.major}.{version.minor}.{version.micro}")
         return False
     print(f"Python version {version.major}.{version.minor}.{version.micro} is compatible.")
@@ -17,7 +24,13 @@ def install_requirements():
     """Install the required packages."""
     print("Installing requirements...")
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+        # Skip pip's self-update check and prompts, prefer wheels over source builds,
+        # and leave .pyc generation to the first import
+        subprocess.check_call([
+            sys.executable, "-m", "pip", "install",
+            "--disable-pip-version-check", "--no-input", "--prefer-binary", "--no-compile",
+            "-r", "requirements.txt"
+        ])
         print("Requirements installed successfully.")
         return True
     except subprocess.CalledProcessError as e:
@@ -26,11 +39,13 @@ def install_requirements():
 
 def check_env_file():
     """Check if .env file exists, if not create from example."""
-    if os.path.exists(".env"):
+    # One directory listing answers both lookups
+    entries = {entry.name for entry in os.scandir(".")}
+    if ".env" in entries:
         print(".env file already exists.")
         return True
     
-    if os.path.exists(".env.example"):
+    if ".env.example" in entries:
         print(".env file not found. Creating from .env.example...")
         try:
             shutil.copy(".env.example", ".env")
@@ -43,9 +58,7 @@ def check_env_file():
     else:
         print("Neither .env nor .env.example found. Creating basic .env file...")
         try:
-            with open(".env", "w") as f:
-                f.write("DISCORD_CLIENT_ID=your_discord_application_id_here\n")
-                f.write("TMDB_API_KEY=your_tmdb_api_key_here\n")
+            Path(".env").write_text(DEFAULT_ENV)
             print(".env file created. Please edit it with your API keys.")
             return True
         except Exception as e: